@@ -5,11 +5,9 @@ Example usage of config validation functionality.
 
 import sys
 import os
-import yaml
 from pathlib import Path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '.'))
 
-from harvest.config import load_config, validate_config
 from harvest.utils.logger import get_logger
 
 logger = get_logger("example.config")
@@ -17,6 +15,8 @@ logger = get_logger("example.config")
 
 def create_example_configs():
     """Create example config files to demonstrate validation."""
+    # Imported here so the rest of the example starts without loading PyYAML
+    import yaml
     
     # Valid configuration
     valid_config = {
@@ -7,7 +7,7 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '.'))
 
-from harvest.utils.retry import create_retryable_client, retry_with_backoff
+from harvest.utils.retry import retry_with_backoff
 from harvest.utils.logger import get_logger
 
 logger = get_logger("example_retry")
@@ -17,6 +17,8 @@ def example_basic_retry():
     """Example of basic retry usage."""
     logger.info("Example: Basic retry usage")
     
+    from harvest.utils.retry import create_retryable_client
+    
     try:
         # This will automatically retry on failures
         with create_retryable_client(timeout=10) as client:
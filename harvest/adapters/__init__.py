@@ -2,6 +2,67 @@
 Adapters package for different image sources.
 """
 
-from .unsplash import search_unsplash
+from collections.abc import Mapping
+from importlib import import_module
+from typing import Any, Dict, Iterator, Tuple, Type
 
-__all__ = ['search_unsplash']
+from .base import BaseAdapter, ImageItem
+
+# API adapter (module, class) pairs keyed by source name, so an adapter's
+# module is only imported when that source is used
+_SOURCE_MODULES: Dict[str, Tuple[str, str]] = {
+    'unsplash': ('.unsplash', 'UnsplashAdapter'),
+    'bing': ('.bing', 'BingAdapter'),
+    'pexels': ('.pexels', 'PexelsAdapter'),
+}
+
+# Public names resolved on first access
+_LAZY_ATTRS: Dict[str, str] = {
+    'UnsplashAdapter': '.unsplash',
+    'search_unsplash': '.unsplash',
+    'BingAdapter': '.bing',
+    'PexelsAdapter': '.pexels',
+}
+
+
+def get_adapter_class(source: str) -> Type[BaseAdapter]:
+    """
+    Import and return the adapter class for a source.
+    
+    Args:
+        source: Source name (unsplash, bing, pexels)
+        
+    Returns:
+        Adapter class
+        
+    Raises:
+        KeyError: If the source is not registered
+    """
+    module_name, class_name = _SOURCE_MODULES[source]
+    return getattr(import_module(module_name, __name__), class_name)
+
+
+class _SourceRegistry(Mapping[str, Type[BaseAdapter]]):
+    """Read-only mapping of source names to adapter classes, imported on lookup."""
+    
+    def __getitem__(self, source: str) -> Type[BaseAdapter]:
+        return get_adapter_class(source)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(_SOURCE_MODULES)
+    
+    def __len__(self) -> int:
+        return len(_SOURCE_MODULES)
+
+
+# API adapter classes keyed by source name
+SOURCE_REGISTRY: Mapping[str, Type[BaseAdapter]] = _SourceRegistry()
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRS:
+        return getattr(import_module(_LAZY_ATTRS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ['BaseAdapter', 'ImageItem', 'SOURCE_REGISTRY', 'get_adapter_class', 'search_unsplash']
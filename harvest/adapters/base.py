@@ -4,14 +4,148 @@ All adapters should extend this class to ensure consistent interface.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from dataclasses import dataclass, field, fields, asdict
+from functools import lru_cache
+from typing import Any, List, Dict, Optional, Set, Tuple
+import logging
 import os
+import re
 from urllib.parse import urlparse
 from ..utils.logger import get_logger
 from ..utils.http_client import get_http_client
 
 logger = get_logger("harvest.adapters.base")
 
+# Stream downloads in large blocks to keep Python-level loop iterations and
+# write() syscalls per image low.
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+# Flags for writing downloads straight to a raw file descriptor
+_DOWNLOAD_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+# Characters that are invalid in filenames, mapped to underscores in one pass
+_SANITIZE_TABLE = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+_COLLAPSE_RE = re.compile(r'_+')
+
+# Image extension at the end of a URL path
+_EXT_RE = re.compile(r'\.(jpe?g|png|gif|webp|bmp|tiff|svg)$', re.IGNORECASE)
+
+# Content type substrings mapped to file extensions, checked in order
+CONTENT_TYPE_EXTENSIONS: Tuple[Tuple[str, str], ...] = (
+    ('jpeg', '.jpg'),
+    ('jpg', '.jpg'),
+    ('png', '.png'),
+    ('gif', '.gif'),
+    ('webp', '.webp'),
+    ('svg', '.svg'),
+)
+
+
+@lru_cache(maxsize=4096)
+def lookup_file_extension(url: str, content_type: str = None,
+                          content_types: Tuple[Tuple[str, str], ...] = CONTENT_TYPE_EXTENSIONS) -> str:
+    """
+    Determine file extension from URL or content type.
+    
+    Results are cached since the same URLs are resolved repeatedly
+    while generating filenames for a batch of search results.
+    
+    Args:
+        url: Image URL
+        content_type: HTTP content type header
+        content_types: Content type substrings mapped to extensions
+        
+    Returns:
+        File extension (including the dot)
+    """
+    # Try to get extension from URL
+    match = _EXT_RE.search(urlparse(url).path)
+    if match:
+        return '.' + match.group(1).lower()
+    
+    # Try to get extension from content type
+    if content_type:
+        content_type = content_type.lower()
+        for token, extension in content_types:
+            if token in content_type:
+                return extension
+    
+    # Default to .jpg if we can't determine
+    return '.jpg'
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """
+    Write all of data to a raw file descriptor, retrying on short writes.
+    
+    Args:
+        fd: Open file descriptor
+        data: Bytes to write
+    """
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _drop_page_cache(fd: int) -> None:
+    """
+    Write a file's data to disk and advise the kernel to evict its cached pages.
+    
+    POSIX_FADV_DONTNEED only evicts clean pages, so the data is synced first.
+    
+    Args:
+        fd: Open file descriptor
+    """
+    try:
+        os.fdatasync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except OSError:
+        pass
+
+
+@dataclass(slots=True)
+class ImageItem:
+    """
+    Metadata for a single image search result.
+    
+    Supports read-only mapping access (item['url'], item.get('id')) so code
+    written against the legacy dict results keeps working during migration.
+    Source-specific fields that have no slot are kept in ``extra``.
+    """
+    url: str
+    id: str
+    source: str
+    title: str = ""
+    width: Optional[int] = None
+    height: Optional[int] = None
+    content_type: str = ""
+    thumbnail: str = ""
+    extra: Dict[str, Any] = field(default_factory=dict)
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in _IMAGE_ITEM_FIELDS:
+            return getattr(self, key)
+        return self.extra[key]
+    
+    def __contains__(self, key: str) -> bool:
+        return key in _IMAGE_ITEM_FIELDS or key in self.extra
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value for key, or default if it is not set."""
+        if key in _IMAGE_ITEM_FIELDS:
+            return getattr(self, key)
+        return self.extra.get(key, default)
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Convert to the legacy dictionary format."""
+        data = asdict(self)
+        data.update(data.pop('extra'))
+        return data
+
+
+_IMAGE_ITEM_FIELDS = frozenset(f.name for f in fields(ImageItem)) - {'extra'}
+
 
 class BaseAdapter(ABC):
     """
@@ -21,6 +155,20 @@ class BaseAdapter(ABC):
     to provide a consistent interface for image harvesting.
     """
     
+    # Fixed per-instance attributes; subclasses without __slots__ still get a __dict__
+    __slots__ = ('config', 'http_client', 'drop_page_cache', '_dirs_ensured')
+    
+    # Content types recognised by _get_file_extension
+    CONTENT_TYPE_EXTENSIONS = CONTENT_TYPE_EXTENSIONS
+    
+    # Per-class logger, assigned once in __init_subclass__
+    logger: logging.Logger = logger
+    
+    def __init_subclass__(cls, **kwargs):
+        """Give each adapter class its own logger, created once at class definition."""
+        super().__init_subclass__(**kwargs)
+        cls.logger = get_logger(f"harvest.adapters.{cls.__name__.lower()}")
+    
     def __init__(self, config: Dict = None):
         """
         Initialize the adapter with optional configuration.
@@ -29,13 +177,18 @@ class BaseAdapter(ABC):
             config: Configuration dictionary for the adapter
         """
         self.config = config or {}
-        self.logger = get_logger(f"harvest.adapters.{self.__class__.__name__.lower()}")
         
         # Initialize HTTP client for downloads
         self.http_client = get_http_client(self.config.get('http_client', {}))
+        
+        # Flush each download and evict it from the page cache (off to skip the fsync)
+        self.drop_page_cache = self.config.get('drop_page_cache', True) and hasattr(os, 'posix_fadvise')
+        
+        # Output directories already created by this adapter
+        self._dirs_ensured: Set[str] = set()
     
     @abstractmethod
-    def search(self, query: str, limit: int) -> List[Dict]:
+    def search(self, query: str, limit: int) -> List[ImageItem]:
         """
         Search for images based on a query string.
         
@@ -44,7 +197,7 @@ class BaseAdapter(ABC):
             limit: Maximum number of results to return
             
         Returns:
-            List of dictionaries containing image metadata with keys:
+            List of ImageItem results (or legacy dictionaries) with fields:
             - url: Image URL
             - id: Unique identifier for the image
             - source: Source of the image (e.g., 'unsplash', 'google', 'bing')
@@ -55,12 +208,12 @@ class BaseAdapter(ABC):
         pass
     
     @abstractmethod
-    def download(self, item: Dict, output_dir: str) -> str:
+    def download(self, item: ImageItem, output_dir: str) -> str:
         """
         Download an image from the provided item metadata.
         
         Args:
-            item: Dictionary containing image metadata (from search results)
+            item: Image metadata (from search results)
             output_dir: Directory to save the downloaded image
             
         Returns:
@@ -79,33 +232,7 @@ class BaseAdapter(ABC):
         Returns:
             File extension (including the dot)
         """
-        # Try to get extension from URL
-        parsed_url = urlparse(url)
-        path = parsed_url.path.lower()
-        
-        # Common image extensions
-        image_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp', '.tiff', '.svg']
-        
-        for ext in image_extensions:
-            if path.endswith(ext):
-                return ext
-        
-        # Try to get extension from content type
-        if content_type:
-            content_type = content_type.lower()
-            if 'jpeg' in content_type or 'jpg' in content_type:
-                return '.jpg'
-            elif 'png' in content_type:
-                return '.png'
-            elif 'gif' in content_type:
-                return '.gif'
-            elif 'webp' in content_type:
-                return '.webp'
-            elif 'svg' in content_type:
-                return '.svg'
-        
-        # Default to .jpg if we can't determine
-        return '.jpg'
+        return lookup_file_extension(url, content_type, self.CONTENT_TYPE_EXTENSIONS)
     
     def _sanitize_filename(self, filename: str) -> str:
         """
@@ -117,18 +244,11 @@ class BaseAdapter(ABC):
         Returns:
             Sanitized filename safe for filesystem
         """
-        # Remove or replace invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, '_')
-        
-        # Remove multiple consecutive underscores
-        while '__' in filename:
-            filename = filename.replace('__', '_')
+        # Replace invalid characters and collapse runs of underscores
+        filename = _COLLAPSE_RE.sub('_', filename.translate(_SANITIZE_TABLE))
         
         # Limit length
-        if len(filename) > 200:
-            filename = filename[:200]
+        filename = filename[:200]
         
         return filename.strip('_')
     
@@ -145,14 +265,33 @@ class BaseAdapter(ABC):
             True if download successful, False otherwise
         """
         try:
+            # Ensure directory exists before opening the stream, once per directory
+            output_dir = os.path.dirname(output_path)
+            if output_dir not in self._dirs_ensured:
+                os.makedirs(output_dir, exist_ok=True)
+                self._dirs_ensured.add(output_dir)
+            
+            # Images are already compressed, so ask for the body as-is and skip decoding
+            request_headers = {'Accept-Encoding': 'identity', **(headers or {})}
+            
             # Use centralized HTTP client with User-Agent rotation and proxy support
-            with self.http_client.stream('GET', url, headers=headers) as response:
-                # Ensure directory exists
-                os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            with self.http_client.stream('GET', url, headers=request_headers) as response:
+                content_encoding = response.headers.get('content-encoding', 'identity').lower()
+                if content_encoding == 'identity':
+                    chunks = response.iter_raw(chunk_size=DOWNLOAD_CHUNK_SIZE)
+                else:
+                    chunks = response.iter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE)
                 
-                with open(output_path, 'wb') as f:
-                    for chunk in response.iter_bytes(chunk_size=8192):
-                        f.write(chunk)
+                fd = os.open(output_path, _DOWNLOAD_OPEN_FLAGS, 0o644)
+                try:
+                    for chunk in chunks:
+                        _write_all(fd, chunk)
+                    
+                    # Downloaded images are not re-read right away, keep them out of the page cache
+                    if self.drop_page_cache:
+                        _drop_page_cache(fd)
+                finally:
+                    os.close(fd)
                 
                 self.logger.info(f"Successfully downloaded: {output_path}")
                 return True
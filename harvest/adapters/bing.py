@@ -3,13 +3,56 @@ Bing Image Search adapter for PixVault.
 Uses Bing Image Search API to find and download images.
 """
 
+import math
 import os
 import uuid
 import hashlib
-from typing import List, Dict
-from urllib.parse import urlparse
-from ..utils.http_client import get_http_client
-from .base import BaseAdapter
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Any, ClassVar, List, Dict, Mapping, Set
+from ..utils.json_utils import response_json
+from .base import BaseAdapter, ImageItem
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Bing API max is 150 results per request
+BING_MAX_PAGE_SIZE = 150
+BING_MAX_PAGE_WORKERS = 8
+
+
+def _url_hash(url: str) -> int:
+    """
+    Hash a URL into a 64-bit integer.
+    
+    The hash is only used as an identity token for deduplication, IDs and
+    filenames, so a fast non-cryptographic hash is used instead of MD5.
+    
+    Args:
+        url: URL to hash
+        
+    Returns:
+        64-bit hash value
+    """
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_intdigest(url.encode())
+    return int.from_bytes(hashlib.blake2b(url.encode(), digest_size=8).digest(), 'big')
+
+
+def _url_digest(url: str) -> str:
+    """
+    Hash a URL into a 16 character hex string.
+    
+    Args:
+        url: URL to hash
+        
+    Returns:
+        Hex digest string
+    """
+    return format(_url_hash(url), '016x')
 
 
 class BingAdapter(BaseAdapter):
@@ -17,6 +60,21 @@ class BingAdapter(BaseAdapter):
     Bing adapter for searching and downloading images from Bing Image Search API.
     """
     
+    # Static search request parameters shared by all instances
+    _DEFAULT_PARAMS: ClassVar[Mapping[str, Any]] = MappingProxyType({
+        "mkt": "en-US",
+        "safeSearch": "Moderate",
+        "imageType": "Photo",
+        "size": "All",
+        "offset": 0
+    })
+    
+    # Bing also serves BMP and TIFF images
+    CONTENT_TYPE_EXTENSIONS = BaseAdapter.CONTENT_TYPE_EXTENSIONS + (
+        ('bmp', '.bmp'),
+        ('tiff', '.tiff'),
+    )
+    
     def __init__(self, config: Dict = None):
         """
         Initialize the Bing adapter.
@@ -31,74 +89,115 @@ class BingAdapter(BaseAdapter):
         
         self.base_url = "https://api.bing.microsoft.com/v7.0/images/search"
         
-        # Initialize HTTP client
-        self.http_client = get_http_client(self.config.get('http_client', {}))
+        # Include informational fields (thumbnail, host page, size, format) in results
+        self.verbose = self.config.get('verbose', False)
+        
+        # Auth header, built once per adapter
+        self._headers = MappingProxyType({
+            "Ocp-Apim-Subscription-Key": self.api_key
+        })
     
-    def search(self, query: str, limit: int) -> List[Dict]:
+    def search(self, query: str, limit: int) -> List[ImageItem]:
         """
         Search for images using Bing Image Search API.
         
+        Requests for more than one page of results are fetched concurrently.
+        
         Args:
             query: Search query string
             limit: Maximum number of results to return
             
         Returns:
-            List of dictionaries containing image metadata with keys: url, id, source, title, width, height
+            List of ImageItem results with url, id, source, title, width and height
         """
-        params = {
-            "q": query,
-            "count": min(limit, 150),  # Bing API max is 150 per request
-            "offset": 0,
-            "mkt": "en-US",
-            "safeSearch": "Moderate",
-            "imageType": "Photo",
-            "size": "All"
-        }
+        pages = max(1, math.ceil(limit / BING_MAX_PAGE_SIZE))
         
-        try:
-            # Prepare headers with API key
-            headers = {
-                "Ocp-Apim-Subscription-Key": self.api_key
-            }
+        if pages == 1:
+            page_results = [self._search_page(query, min(limit, BING_MAX_PAGE_SIZE), 0)]
+        else:
+            def fetch_page(page: int) -> List[ImageItem]:
+                offset = page * BING_MAX_PAGE_SIZE
+                return self._search_page(query, min(limit - offset, BING_MAX_PAGE_SIZE), offset)
             
+            with ThreadPoolExecutor(max_workers=min(pages, BING_MAX_PAGE_WORKERS)) as executor:
+                page_results = list(executor.map(fetch_page, range(pages)))
+        
+        # Merge pages in order, dropping image URLs Bing returns more than once
+        results = []
+        seen: Set[int] = set()
+        for page in page_results:
+            for result in page:
+                url_hash = _url_hash(result.url)
+                if url_hash in seen:
+                    continue
+                seen.add(url_hash)
+                results.append(result)
+        
+        self.logger.info(f"Successfully retrieved {len(results)} images from Bing for query: {query}")
+        return results[:limit]
+    
+    def _search_page(self, query: str, count: int, offset: int) -> List[ImageItem]:
+        """
+        Fetch a single page of Bing Image Search results.
+        
+        Args:
+            query: Search query string
+            count: Number of results to request (at most BING_MAX_PAGE_SIZE)
+            offset: Number of results to skip
+            
+        Returns:
+            List of ImageItem results, empty on error
+        """
+        params = {**self._DEFAULT_PARAMS, "q": query, "count": count, "offset": offset}
+        
+        try:
             # Use centralized HTTP client with User-Agent rotation and proxy support
-            response = self.http_client.get(self.base_url, headers=headers, params=params)
+            response = self.http_client.get(self.base_url, headers=self._headers, params=params)
             
-            data = response.json()
+            data = response_json(response)
             results = []
+            append = results.append
+            verbose = self.verbose
+            generate_id = self._generate_image_id
             
-            for image in data.get("value", []):
-                # Extract image metadata
-                result = {
-                    "url": image.get("contentUrl", ""),
-                    "id": self._generate_image_id(image),
-                    "source": "bing",
-                    "title": image.get("name", ""),
-                    "width": image.get("width"),
-                    "height": image.get("height"),
-                    "thumbnail": image.get("thumbnailUrl", ""),
-                    "host_page": image.get("hostPageUrl", ""),
-                    "content_size": image.get("contentSize", ""),
-                    "encoding_format": image.get("encodingFormat", "")
-                }
+            for image in data.get("value", ()):
+                image_get = image.get
                 
                 # Only include images with valid URLs
-                if result["url"]:
-                    results.append(result)
+                url = image_get("contentUrl")
+                if not url:
+                    continue
+                
+                # Extract image metadata
+                result = ImageItem(
+                    url=url,
+                    id=generate_id(image, url),
+                    source="bing",
+                    title=image_get("name", ""),
+                    width=image_get("width"),
+                    height=image_get("height")
+                )
+                
+                if verbose:
+                    result.thumbnail = image_get("thumbnailUrl", "")
+                    result.extra["host_page"] = image_get("hostPageUrl", "")
+                    result.extra["content_size"] = image_get("contentSize", "")
+                    result.extra["encoding_format"] = image_get("encodingFormat", "")
+                
+                append(result)
             
-            self.logger.info(f"Successfully retrieved {len(results)} images from Bing for query: {query}")
-            return results[:limit]
+            return results
             
         except Exception as e:
-            self.logger.error(f"Error occurred while searching Bing: {e}")
+            self.logger.error(f"Error occurred while searching Bing (offset {offset}): {e}")
             return []
     
-    def download(self, item: Dict, output_dir: str) -> str:
+    def download(self, item: ImageItem, output_dir: str) -> str:
         """
         Download an image from Bing search results.
         
         Args:
-            item: Dictionary containing image metadata (from search results)
+            item: Image metadata (from search results)
             output_dir: Directory to save the downloaded image
             
         Returns:
@@ -118,12 +217,13 @@ class BingAdapter(BaseAdapter):
         else:
             raise RuntimeError(f"Failed to download image from {url}")
     
-    def _generate_image_id(self, image_data: Dict) -> str:
+    def _generate_image_id(self, image_data: Dict, url: str = None) -> str:
         """
         Generate a unique ID for the image based on its properties.
         
         Args:
             image_data: Image data from Bing API
+            url: Image content URL, if already extracted from image_data
             
         Returns:
             Unique identifier string
@@ -134,15 +234,16 @@ class BingAdapter(BaseAdapter):
             return f"bing_{bing_id}"
         
         # Generate ID based on URL hash
-        url = image_data.get("contentUrl", "")
+        if url is None:
+            url = image_data.get("contentUrl", "")
         if url:
-            url_hash = hashlib.md5(url.encode()).hexdigest()[:12]
+            url_hash = _url_digest(url)[:12]
             return f"bing_{url_hash}"
         
         # Fallback to UUID
         return f"bing_{uuid.uuid4().hex[:12]}"
     
-    def _generate_unique_filename(self, item: Dict, url: str) -> str:
+    def _generate_unique_filename(self, item: ImageItem, url: str) -> str:
         """
         Generate a unique filename for the downloaded image.
         
@@ -156,62 +257,12 @@ class BingAdapter(BaseAdapter):
         # Get file extension
         extension = self._get_file_extension(url)
         
-        # Generate unique identifier
-        image_id = item.get('id', '')
-        if image_id:
-            # Use the image ID as base
-            base_name = image_id
-        else:
-            # Generate UUID-based name
-            base_name = f"bing_{uuid.uuid4().hex[:12]}"
+        # Use the image ID as base, falling back to a UUID-based name
+        base_name = item.get('id') or f"bing_{uuid.uuid4().hex[:12]}"
         
         # Add content hash for additional uniqueness
-        url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
+        url_hash = _url_digest(url)[:8]
         filename = f"{base_name}_{url_hash}{extension}"
         
         # Sanitize filename
         return self._sanitize_filename(filename)
-    
-    def _get_file_extension(self, url: str, content_type: str = None) -> str:
-        """
-        Determine file extension from URL or content type.
-        Override base method to handle Bing-specific cases.
-        
-        Args:
-            url: Image URL
-            content_type: HTTP content type header
-            
-        Returns:
-            File extension (including the dot)
-        """
-        # Try to get extension from URL
-        parsed_url = urlparse(url)
-        path = parsed_url.path.lower()
-        
-        # Common image extensions
-        image_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp', '.tiff', '.svg']
-        
-        for ext in image_extensions:
-            if path.endswith(ext):
-                return ext
-        
-        # Try to get extension from content type
-        if content_type:
-            content_type = content_type.lower()
-            if 'jpeg' in content_type or 'jpg' in content_type:
-                return '.jpg'
-            elif 'png' in content_type:
-                return '.png'
-            elif 'gif' in content_type:
-                return '.gif'
-            elif 'webp' in content_type:
-                return '.webp'
-            elif 'svg' in content_type:
-                return '.svg'
-            elif 'bmp' in content_type:
-                return '.bmp'
-            elif 'tiff' in content_type:
-                return '.tiff'
-        
-        # Default to .jpg if we can't determine
-        return '.jpg'
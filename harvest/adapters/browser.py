@@ -1,13 +1,338 @@
 import asyncio
+import atexit
 import random
-import time
+import threading
 import re
 import os
-from typing import List, Dict, Optional
-from urllib.parse import urlparse
-from playwright.async_api import async_playwright, Browser, Page, TimeoutError as PlaywrightTimeoutError
+import sys
+import weakref
+from functools import lru_cache
+from typing import TYPE_CHECKING, Awaitable, Callable, List, Dict, Optional, Type, TypeVar
+from urllib.parse import quote_plus, urlparse
 from .base import BaseAdapter
 
+# Playwright is imported when a browser is started, so API-only users don't pay for it
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Page
+
+T = TypeVar('T')
+
+# Request headers and viewport applied to every browser context
+EXTRA_HTTP_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+VIEWPORT = {'width': 1920, 'height': 1080}
+
+# Navigation waits for DOMContentLoaded only; image results are awaited separately (ms)
+NAVIGATION_TIMEOUT = 8000
+IMAGES_READY_TIMEOUT = 3000
+MIN_IMAGES_READY = 20
+
+# Images at or below this width/height (px) are treated as icons and skipped
+MIN_IMAGE_SIZE = 50
+
+# Resource types aborted in browser contexts; only <img> src strings are needed
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font', 'stylesheet', 'texttrack', 'manifest'})
+
+_CHROME_VERSION_RE = re.compile(r'Chrome/(\d+)')
+
+
+def _client_hint_headers(user_agent: str) -> Dict[str, str]:
+    """
+    Build sec-ch-ua client hints consistent with a Chrome User-Agent.
+    
+    Args:
+        user_agent: User-Agent string the context will send
+        
+    Returns:
+        Client hint headers, or an empty dictionary for non-Chrome agents
+    """
+    match = _CHROME_VERSION_RE.search(user_agent)
+    if not match:
+        return {}
+    
+    version = match.group(1)
+    if 'Windows' in user_agent:
+        platform = '"Windows"'
+    elif 'Macintosh' in user_agent:
+        platform = '"macOS"'
+    else:
+        platform = '"Linux"'
+    
+    return {
+        'sec-ch-ua': f'"Not_A Brand";v="8", "Chromium";v="{version}", "Google Chrome";v="{version}"',
+        'sec-ch-ua-mobile': '?0',
+        'sec-ch-ua-platform': platform,
+    }
+
+
+# Common captcha indicators
+CAPTCHA_SELECTORS = (
+    '[class*="captcha"]',
+    '[id*="captcha"]',
+    '[class*="recaptcha"]',
+    '[id*="recaptcha"]',
+    'iframe[src*="recaptcha"]',
+    '[class*="hcaptcha"]',
+    '[id*="hcaptcha"]'
+)
+
+# Captcha / block page markers in the page URL or title (e.g. Google's /sorry/index interstitial)
+_CAPTCHA_MARKERS = frozenset({'captcha', 'recaptcha', 'sorry/index', 'unusual traffic'})
+_CAPTCHA_MARKER_PATTERN = '|'.join(re.escape(marker) for marker in sorted(_CAPTCHA_MARKERS))
+
+# Common login indicators (plain CSS; "Login"/"Sign In" button text is matched in JS)
+LOGIN_SELECTORS = (
+    'input[type="password"]',
+    '[class*="login"]',
+    '[id*="login"]',
+    '[class*="signin"]',
+    '[id*="signin"]'
+)
+
+# Image search engines as (name, URL template, rate-limit domain); {q} is the URL-encoded query
+_ENGINES = (
+    ('google', 'https://www.google.com/search?tbm=isch&safe=off&q={q}', 'google.com'),
+    ('bing', 'https://www.bing.com/images/search?form=HDRSC2&q={q}', 'bing.com'),
+)
+_ENGINE_DOMAINS = tuple(sys.intern(domain) for _, _, domain in _ENGINES)
+
+# In-page image extractor registered on every context as window.__pvExtract
+EXTRACT_JS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'extract.js')
+CALL_EXTRACT_JS = """
+([minW, minH, cap]) => typeof window.__pvExtract === 'function' ? window.__pvExtract(minW, minH, cap) : null
+"""
+
+
+@lru_cache(maxsize=1)
+def _extract_script() -> str:
+    """Return the source of the in-page image extractor."""
+    with open(EXTRACT_JS_PATH, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+# Scroll by each distance with a 0.5-1.5s pause, like the user scrolling through results
+SCROLL_JS = """
+async (scrolls) => {
+    for (const s of scrolls) {
+        window.scrollBy(0, s);
+        await new Promise(r => setTimeout(r, 500 + Math.random() * 1000));
+    }
+}
+"""
+
+CHECK_BLOCKERS_JS = """
+([captchaSelectors, loginSelectors, markerPattern]) => {
+    if (new RegExp(markerPattern, 'i').test(location.href + ' ' + document.title)) return 'captcha';
+    for (const s of captchaSelectors) if (document.querySelector(s)) return 'captcha';
+    for (const s of loginSelectors) if (document.querySelector(s)) return 'login';
+    if ([...document.querySelectorAll('button, a')].some(e => /login|sign in/i.test(e.textContent))) return 'login';
+    return null;
+}
+"""
+
+
+async def launch_chromium(playwright) -> 'Browser':
+    """
+    Launch Chromium with the adapter's standard flags.
+    
+    Chromium's new headless mode has the same fingerprint as headed Chrome;
+    Playwright's headless=True still selects the old mode. Other flags are
+    kept to the minimum; anti-detection lives in the context options.
+    
+    Args:
+        playwright: Started Playwright instance
+        
+    Returns:
+        Launched Browser
+    """
+    return await playwright.chromium.launch(
+        headless=False,
+        args=[
+            '--headless=new',
+            '--no-sandbox',
+            '--disable-dev-shm-usage',
+            '--disable-blink-features=AutomationControlled'
+        ]
+    )
+
+
+class TokenBucket:
+    """
+    Async token bucket rate limiter.
+    
+    Holds up to ``capacity`` tokens, refilled continuously at ``rate`` tokens
+    per second. Waiters are served in order under a lock, so concurrent
+    callers can't both take the same token.
+    """
+    
+    __slots__ = ('capacity', 'rate', 'tokens', 'ts', '_lock')
+    
+    def __init__(self, capacity: float, rate: float):
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity
+        self.ts: Optional[float] = None
+        self._lock = asyncio.Lock()
+    
+    def _refill(self, now: float) -> None:
+        """Add the tokens accrued since the last refill."""
+        if self.ts is not None:
+            self.tokens = min(self.capacity, self.tokens + (now - self.ts) * self.rate)
+        self.ts = now
+    
+    def try_acquire(self, n: float = 1) -> bool:
+        """
+        Take ``n`` tokens if available, without waiting.
+        
+        Args:
+            n: Number of tokens to take
+            
+        Returns:
+            True if the tokens were taken
+        """
+        self._refill(asyncio.get_running_loop().time())
+        if self.tokens >= n:
+            self.tokens -= n
+            return True
+        return False
+    
+    async def acquire(self, n: float = 1) -> float:
+        """
+        Take ``n`` tokens, sleeping only as long as needed to accrue them.
+        
+        Args:
+            n: Number of tokens to take
+            
+        Returns:
+            Seconds spent waiting
+        """
+        async with self._lock:
+            waited = 0.0
+            while not self.try_acquire(n):
+                delay = (n - self.tokens) / self.rate
+                await asyncio.sleep(delay)
+                waited += delay
+            return waited
+
+
+class RetryBudget:
+    """
+    Retries and wall-clock time shared by all engine searches of one fetch.
+    
+    Bounds the work done when every attempt keeps failing, e.g. while the
+    proxy pool is degraded, instead of each engine retrying on its own.
+    """
+    
+    __slots__ = ('retries', 'deadline')
+    
+    def __init__(self, retries: int, seconds: float):
+        self.retries = retries
+        self.deadline = asyncio.get_running_loop().time() + seconds
+    
+    def remaining(self) -> float:
+        """Seconds left before the deadline (never negative)."""
+        return max(0.0, self.deadline - asyncio.get_running_loop().time())
+    
+    def take(self) -> bool:
+        """
+        Use up one retry, if any are left and the deadline hasn't passed.
+        
+        Returns:
+            True if the caller may retry
+        """
+        if self.retries <= 0 or not self.remaining():
+            return False
+        self.retries -= 1
+        return True
+
+
+class BrowserPool:
+    """
+    One Playwright driver and Chromium instance shared by adapters on an event loop.
+    
+    Adapters take isolated BrowserContexts from the shared browser (proxy is a
+    per-context option) instead of launching their own Chromium process.
+    Adapters acquire and release the browser; it is closed when the last one
+    releases it, unless the pool is persistent (the shared browser loop).
+    """
+    
+    def __init__(self, persistent: bool = False):
+        self.playwright = None
+        self.browser: Optional['Browser'] = None
+        self.persistent = persistent
+        self._users = 0
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> 'Browser':
+        """
+        Get the shared browser, launching it on first use or after a crash.
+        
+        The caller counts as a user of the pool until it calls release().
+        
+        Returns:
+            Connected Browser
+        """
+        async with self._lock:
+            if self.browser is None or not self.browser.is_connected():
+                if self.playwright is None:
+                    from playwright.async_api import async_playwright
+                    self.playwright = await async_playwright().start()
+                self.browser = await launch_chromium(self.playwright)
+            self._users += 1
+            return self.browser
+    
+    async def release(self) -> None:
+        """Drop a user taken by acquire(), closing a non-persistent pool after the last one."""
+        async with self._lock:
+            self._users = max(0, self._users - 1)
+            if self._users == 0 and not self.persistent:
+                await self._close()
+    
+    async def close(self) -> None:
+        """Close the browser and stop Playwright."""
+        async with self._lock:
+            await self._close()
+    
+    async def _close(self) -> None:
+        """Close the browser and stop Playwright; caller holds the lock."""
+        if self.browser:
+            await self.browser.close()
+            self.browser = None
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
+
+
+# Browser pools keyed by the event loop they run on
+_browser_pools: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, BrowserPool]' = weakref.WeakKeyDictionary()
+
+
+def get_browser_pool() -> BrowserPool:
+    """
+    Get the browser pool for the running event loop.
+    
+    Returns:
+        BrowserPool instance
+    """
+    loop = asyncio.get_running_loop()
+    pool = _browser_pools.get(loop)
+    if pool is None:
+        pool = _browser_pools[loop] = BrowserPool()
+    return pool
+
+
+async def close_browser_pool() -> None:
+    """Close the running event loop's browser pool, if any."""
+    pool = _browser_pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool.close()
+
 
 class BrowserAdapter(BaseAdapter):
     """
@@ -15,156 +340,219 @@ class BrowserAdapter(BaseAdapter):
     Uses Playwright with human-like behavior simulation.
     """
     
+    __slots__ = (
+        'browser', 'rate_limit_min', 'rate_limit_max', 'rate_limit_burst',
+        '_buckets', '_refcount', '_start_lock', 'blocked_resource_types',
+        '_engine_semaphore', 'max_retries', 'retry_budget_seconds', '_timeout_error',
+    )
+    
+    # Maximum pages open at once across all instances (per event loop)
+    MAX_PAGES = int(os.getenv('PIXVAULT_MAX_PAGES', '4'))
+    _page_semaphores: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]' = weakref.WeakKeyDictionary()
+    
     def __init__(self, config: Dict = None):
         super().__init__(config)
-        self.browser: Optional[Browser] = None
-        self.playwright = None
-        self.domain_delays = {}  # Track last request time per domain
+        self.browser: Optional['Browser'] = None
         self.rate_limit_min = self.config.get('rate_limit_min', 5)  # Minimum delay in seconds
         self.rate_limit_max = self.config.get('rate_limit_max', 15)  # Maximum delay in seconds
+        self.rate_limit_burst = self.config.get('rate_limit_burst', 2)  # Requests allowed back to back
         
-    async def __aenter__(self):
-        """Async context manager entry."""
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(
-            headless=True,
-            args=[
-                '--no-sandbox',
-                '--disable-dev-shm-usage',
-                '--disable-blink-features=AutomationControlled',
-                '--disable-web-security',
-                '--disable-features=VizDisplayCompositor'
-            ]
+        # Playwright's TimeoutError once a browser has been started
+        self._timeout_error: Type[Exception] = TimeoutError
+        
+        # Rate limit token bucket per domain, created up front for the known engines
+        self._buckets: Dict[str, TokenBucket] = {domain: self._new_bucket() for domain in _ENGINE_DOMAINS}
+        
+        # Number of active `async with` blocks sharing this browser
+        self._refcount = 0
+        self._start_lock = asyncio.Lock()
+        
+        # Resource types aborted in every context (empty to load everything)
+        self.blocked_resource_types = frozenset(
+            self.config.get('blocked_resource_types', BLOCKED_RESOURCE_TYPES)
         )
+        
+        # Cap on search engines queried concurrently by fetch_images
+        self._engine_semaphore = asyncio.Semaphore(self.config.get('max_concurrent_engines', 2))
+        
+        # Retries allowed per fetch_images call across all engines, and the time
+        # after which no new retry starts (attempts in flight are not cut short)
+        self.max_retries = self.config.get('max_retries', 2)
+        self.retry_budget_seconds = self.config.get('retry_budget_seconds', 30)
+        
+    async def __aenter__(self):
+        """
+        Async context manager entry.
+        
+        Re-entrant: the browser is taken from the event loop's pool on first
+        entry and shared by nested or concurrent users until the last one exits.
+        """
+        async with self._start_lock:
+            if not self.browser:
+                await self._start()
+            self._refcount += 1
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
+        async with self._start_lock:
+            self._refcount = max(0, self._refcount - 1)
+            if self._refcount == 0:
+                await self.close()
+    
+    async def _start(self) -> None:
+        """Take the Chromium instance shared by adapters on the event loop."""
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+        
+        self._timeout_error = PlaywrightTimeoutError
+        self.browser = await get_browser_pool().acquire()
+    
+    async def close(self) -> None:
+        """Release the browser to the event loop's pool, which closes it after its last user."""
         if self.browser:
-            await self.browser.close()
-        if self.playwright:
-            await self.playwright.stop()
+            self.browser = None
+            await get_browser_pool().release()
+    
+    async def get_context(self, **options) -> 'BrowserContext':
+        """
+        Create an isolated browser context (own cookies and cache) on the shared browser.
+        
+        Args:
+            **options: Extra Playwright new_context options (e.g. proxy)
+            
+        Returns:
+            New BrowserContext; the caller is responsible for closing it
+        """
+        if not self.browser:
+            raise RuntimeError("Browser not initialized. Use async context manager.")
+        
+        # Never advertise headless mode in the UA or client hints
+        user_agent = self.http_client.get_random_user_agent().replace('HeadlessChrome', 'Chrome')
+        
+        context = await self.browser.new_context(
+            user_agent=user_agent,
+            viewport=VIEWPORT,
+            extra_http_headers={**EXTRA_HTTP_HEADERS, **_client_hint_headers(user_agent)},
+            **options
+        )
+        
+        # Compiled once per document instead of shipping the extractor on every call
+        await context.add_init_script(path=EXTRACT_JS_PATH)
+        
+        if self.blocked_resource_types:
+            await context.route('**/*', self._block_resources)
+        
+        return context
     
-    async def _simulate_human_behavior(self, page: Page) -> None:
+    async def _block_resources(self, route) -> None:
+        """Abort requests for resource types that are not needed for extraction."""
+        if route.request.resource_type in self.blocked_resource_types:
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    async def _simulate_human_behavior(self, page: 'Page') -> None:
         """Simulate human-like mouse movements and scrolling."""
         try:
-            # Random scroll behavior
-            scroll_count = random.randint(2, 5)
-            for _ in range(scroll_count):
-                scroll_distance = random.randint(200, 800)
-                await page.mouse.wheel(0, scroll_distance)
-                await asyncio.sleep(random.uniform(0.5, 1.5))
+            # Random scroll behavior, precomputed and replayed in-page in one round-trip
+            scrolls = [random.randint(200, 800) for _ in range(random.randint(2, 5))]
+            await page.evaluate(SCROLL_JS, scrolls)
             
-            # Random mouse movements
+            # Random mouse movements, dispatched as one batch followed by a single pause
             viewport = page.viewport_size
             if viewport:
-                for _ in range(random.randint(3, 8)):
-                    x = random.randint(0, viewport['width'])
-                    y = random.randint(0, viewport['height'])
-                    await page.mouse.move(x, y)
-                    await asyncio.sleep(random.uniform(0.1, 0.3))
+                path = [
+                    (random.randint(0, viewport['width']), random.randint(0, viewport['height']))
+                    for _ in range(random.randint(3, 8))
+                ]
+                await asyncio.gather(*(page.mouse.move(x, y) for x, y in path))
+                await asyncio.sleep(random.uniform(0.1, 0.3) * len(path))
                     
         except Exception as e:
             self.logger.warning(f"Human behavior simulation failed: {e}")
     
-    async def _check_for_captcha_or_login(self, page: Page) -> bool:
+    async def _check_for_captcha_or_login(self, page: 'Page') -> bool:
         """Check if page requires captcha or login."""
         try:
-            # Common captcha indicators
-            captcha_selectors = [
-                '[class*="captcha"]',
-                '[id*="captcha"]',
-                '[class*="recaptcha"]',
-                '[id*="recaptcha"]',
-                'iframe[src*="recaptcha"]',
-                '[class*="hcaptcha"]',
-                '[id*="hcaptcha"]'
-            ]
-            
-            # Common login indicators
-            login_selectors = [
-                'input[type="password"]',
-                '[class*="login"]',
-                '[id*="login"]',
-                '[class*="signin"]',
-                '[id*="signin"]',
-                'button:has-text("Login")',
-                'button:has-text("Sign In")',
-                'a:has-text("Login")',
-                'a:has-text("Sign In")'
-            ]
-            
-            # Check for captcha
-            for selector in captcha_selectors:
-                if await page.locator(selector).count() > 0:
-                    self.logger.warning("Captcha detected on page")
-                    return True
+            # Single round-trip: all selectors are checked inside the page
+            result = await page.evaluate(
+                CHECK_BLOCKERS_JS, [CAPTCHA_SELECTORS, LOGIN_SELECTORS, _CAPTCHA_MARKER_PATTERN]
+            )
             
-            # Check for login requirements
-            for selector in login_selectors:
-                if await page.locator(selector).count() > 0:
-                    self.logger.warning("Login required on page")
-                    return True
-                    
-            return False
+            if result == 'captcha':
+                self.logger.warning("Captcha detected on page")
+            elif result == 'login':
+                self.logger.warning("Login required on page")
+                
+            return result is not None
             
         except Exception as e:
             self.logger.warning(f"Error checking for captcha/login: {e}")
             return False
     
     async def _enforce_rate_limit(self, domain: str) -> None:
-        """Enforce rate limiting per domain."""
-        current_time = time.time()
+        """
+        Enforce rate limiting per domain.
         
-        if domain in self.domain_delays:
-            time_since_last = current_time - self.domain_delays[domain]
-            required_delay = random.uniform(self.rate_limit_min, self.rate_limit_max)
-            
-            if time_since_last < required_delay:
-                sleep_time = required_delay - time_since_last
-                self.logger.info(f"Rate limiting: waiting {sleep_time:.2f}s for domain {domain}")
-                await asyncio.sleep(sleep_time)
+        Each domain has a token bucket: short bursts up to rate_limit_burst
+        go through immediately, and sustained use is held to one request per
+        (rate_limit_min + rate_limit_max) / 2 seconds on average. Different
+        domains proceed independently.
+        """
+        bucket = self._buckets.get(domain)
+        if bucket is None:
+            bucket = self._buckets[domain] = self._new_bucket()
         
-        self.domain_delays[domain] = time.time()
+        waited = await bucket.acquire()
+        if waited > 0:
+            self.logger.info(f"Rate limiting: waited {waited:.2f}s for domain {domain}")
     
-    async def _extract_images_from_page(self, page: Page, source: str) -> List[Dict[str, str]]:
-        """Extract image URLs from the current page."""
+    def _new_bucket(self) -> TokenBucket:
+        """Create a domain token bucket from the configured rate limits."""
+        average_delay = (self.rate_limit_min + self.rate_limit_max) / 2
+        rate = 1 / average_delay if average_delay > 0 else float('inf')
+        return TokenBucket(self.rate_limit_burst, rate)
+    
+    async def _extract_images_from_page(self, page: 'Page', source: str,
+                                        limit: Optional[int] = None) -> List[Dict[str, str]]:
+        """
+        Extract image URLs from the current page.
+        
+        Deduplication, the minimum size filter and the result cap are applied
+        inside the page so only the final items cross the browser bridge.
+        
+        Args:
+            page: Page showing search results
+            source: Source name to tag results with
+            limit: Maximum number of images to return (None for all)
+            
+        Returns:
+            List of dictionaries with keys: url, id, source
+        """
         try:
-            # Wait for images to load
-            await page.wait_for_load_state('networkidle', timeout=10000)
+            # Wait briefly for results to render, but no longer than needed to
+            # cover the limit; extract whatever is present on timeout
+            ready = MIN_IMAGES_READY if limit is None else min(limit, MIN_IMAGES_READY)
+            try:
+                await page.wait_for_function(
+                    f"document.querySelectorAll('img').length > {ready}",
+                    timeout=IMAGES_READY_TIMEOUT
+                )
+            except self._timeout_error:
+                pass
             
-            # Extract image URLs using various selectors
-            image_data = await page.evaluate("""
-                () => {
-                    const images = [];
-                    const imgElements = document.querySelectorAll('img');
-                    
-                    imgElements.forEach((img, index) => {
-                        const src = img.src || img.getAttribute('data-src') || img.getAttribute('data-lazy-src');
-                        if (src && src.startsWith('http')) {
-                            images.push({
-                                url: src,
-                                id: `img_${index}_${Date.now()}`,
-                                alt: img.alt || '',
-                                width: img.naturalWidth || img.width,
-                                height: img.naturalHeight || img.height
-                            });
-                        }
-                    });
-                    
-                    return images;
-                }
-            """)
+            # Run the extractor registered on the context; pages not created through
+            # get_context() get it injected on demand
+            args = [MIN_IMAGE_SIZE, MIN_IMAGE_SIZE, limit]
+            image_data = await page.evaluate(CALL_EXTRACT_JS, args)
+            if image_data is None:
+                await page.evaluate(_extract_script())
+                image_data = await page.evaluate(CALL_EXTRACT_JS, args)
             
-            results = []
-            for img in image_data:
-                # Filter out very small images (likely icons/buttons)
-                if img.get('width', 0) > 50 and img.get('height', 0) > 50:
-                    results.append({
-                        'url': img['url'],
-                        'id': img['id'],
-                        'source': source
-                    })
+            results = [
+                {'url': img['url'], 'id': img['id'], 'source': source}
+                for img in image_data
+            ]
             
             return results
             
@@ -186,94 +574,149 @@ class BrowserAdapter(BaseAdapter):
         if not self.browser:
             raise RuntimeError("Browser not initialized. Use async context manager.")
         
-        all_results = []
+        # Try multiple search engines
+        q = quote_plus(query)
+        search_engines = [
+            {'name': name, 'url': url_template.format(q=q), 'domain': domain}
+            for name, url_template, domain in _ENGINES
+        ]
         
+        # Results keyed by URL as they arrive, so cross-engine duplicates are
+        # dropped (keeping the first occurrence) and don't count toward max_results
+        unique: Dict[str, Dict[str, str]] = {}
+        
+        # Search engines concurrently, each in its own context; the budget only
+        # decides whether a failed attempt is retried
+        budget = RetryBudget(self.max_retries, self.retry_budget_seconds)
+        tasks = [asyncio.create_task(self._search_one(query, engine, max_results, budget))
+                 for engine in search_engines]
         try:
-            # Create a new page with realistic user agent
-            page = await self.browser.new_page()
-            
-            # Set realistic user agent and viewport
-            await page.set_extra_http_headers({
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate',
-                'DNT': '1',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-            })
-            
-            await page.set_viewport_size({'width': 1920, 'height': 1080})
-            
-            # Try multiple search engines
-            search_engines = [
-                {
-                    'name': 'google',
-                    'url': f'https://www.google.com/search?q={query}&tbm=isch&safe=off',
-                    'domain': 'google.com'
-                },
-                {
-                    'name': 'bing',
-                    'url': f'https://www.bing.com/images/search?q={query}&form=HDRSC2',
-                    'domain': 'bing.com'
-                }
-            ]
-            
-            for search_engine in search_engines:
-                if len(all_results) >= max_results:
-                    break
+            for coro in asyncio.as_completed(tasks):
+                try:
+                    page_results = await coro
+                except Exception as e:
+                    self.logger.error(f"Error in fetch_images: {e}")
+                    continue
                 
+                for result in page_results:
+                    unique.setdefault(result['url'], result)
+                
+                if len(unique) >= max_results:
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        unique_results = list(unique.values())
+        
+        self.logger.info(f"Total unique images found: {len(unique_results)}")
+        return unique_results[:max_results]
+    
+    async def _search_one(self, query: str, search_engine: Dict[str, str],
+                          max_results: int, budget: Optional[RetryBudget] = None) -> List[Dict[str, str]]:
+        """
+        Search a single engine, retrying failures while the budget allows.
+        
+        Args:
+            query: Search query string
+            search_engine: Engine descriptor with name, url and domain
+            max_results: Maximum number of images to extract
+            budget: Retry budget shared with the other engines of this fetch
+            
+        Returns:
+            List of image dictionaries, empty on captcha or once retries run out
+        """
+        async with self._engine_semaphore:
+            while True:
                 try:
-                    # Enforce rate limiting
-                    await self._enforce_rate_limit(search_engine['domain'])
-                    
-                    self.logger.info(f"Searching {search_engine['name']} for: {query}")
-                    
-                    # Navigate to search results
-                    await page.goto(search_engine['url'], wait_until='networkidle', timeout=30000)
-                    
-                    # Check for captcha or login requirements
-                    if await self._check_for_captcha_or_login(page):
-                        self.logger.warning(f"Captcha or login required on {search_engine['name']}, skipping")
-                        continue
-                    
-                    # Simulate human behavior
-                    await self._simulate_human_behavior(page)
-                    
-                    # Extract images from the page
-                    page_results = await self._extract_images_from_page(page, search_engine['name'])
-                    
-                    # Add results up to max_results
-                    remaining = max_results - len(all_results)
-                    all_results.extend(page_results[:remaining])
-                    
-                    self.logger.info(f"Found {len(page_results)} images from {search_engine['name']}")
-                    
-                    # Random delay between search engines
-                    await asyncio.sleep(random.uniform(2, 5))
-                    
-                except PlaywrightTimeoutError:
+                    page_results = await self._search_attempt(query, search_engine, max_results)
+                except self._timeout_error as e:
                     self.logger.warning(f"Timeout loading {search_engine['name']}")
-                    continue
+                    await self._on_search_error(e)
                 except Exception as e:
                     self.logger.error(f"Error searching {search_engine['name']}: {e}")
-                    continue
+                    await self._on_search_error(e)
+                else:
+                    if page_results is not None:
+                        await self._on_search_success()
+                    return page_results or []
+                
+                if budget is None or not budget.take():
+                    return []
+                self.logger.info(f"Retrying {search_engine['name']} ({budget.retries} retries left)")
+    
+    async def _search_attempt(self, query: str, search_engine: Dict[str, str],
+                              max_results: int) -> Optional[List[Dict[str, str]]]:
+        """
+        Make one search attempt on an engine in a fresh browser context.
+        
+        Args:
+            query: Search query string
+            search_engine: Engine descriptor with name, url and domain
+            max_results: Maximum number of images to extract
             
-            await page.close()
+        Returns:
+            List of image dictionaries, or None if blocked by a captcha or login
+        """
+        context = None
+        page_slot = self._page_semaphore()
+        holding_slot = False
+        try:
+            # Enforce rate limiting
+            await self._enforce_rate_limit(search_engine['domain'])
             
-            # Remove duplicates based on URL
-            seen_urls = set()
-            unique_results = []
-            for result in all_results:
-                if result['url'] not in seen_urls:
-                    seen_urls.add(result['url'])
-                    unique_results.append(result)
+            self.logger.info(f"Searching {search_engine['name']} for: {query}")
             
-            self.logger.info(f"Total unique images found: {len(unique_results)}")
-            return unique_results[:max_results]
+            # Bound open pages across all adapter instances
+            await page_slot.acquire()
+            holding_slot = True
             
-        except Exception as e:
-            self.logger.error(f"Error in fetch_images: {e}")
-            return []
+            # Use a fresh context so searches don't share cookies or cache
+            context = await self.get_context()
+            page = await context.new_page()
+            
+            # Navigate to search results
+            await page.goto(search_engine['url'], wait_until='domcontentloaded', timeout=NAVIGATION_TIMEOUT)
+            
+            # Check for captcha or login requirements
+            if await self._check_for_captcha_or_login(page):
+                self.logger.warning(f"Captcha or login required on {search_engine['name']}, skipping")
+                return None
+            
+            # Simulate human behavior
+            await self._simulate_human_behavior(page)
+            
+            # Extract images from the page
+            page_results = await self._extract_images_from_page(page, search_engine['name'], max_results)
+            
+            self.logger.info(f"Found {len(page_results)} images from {search_engine['name']}")
+            return page_results
+            
+        finally:
+            if context:
+                await context.close()
+            if holding_slot:
+                page_slot.release()
+    
+    async def _on_search_success(self) -> None:
+        """Hook called after an engine's results were extracted."""
+    
+    async def _on_search_error(self, error: Exception) -> None:
+        """Hook called when an engine search fails with a timeout or error."""
+    
+    @classmethod
+    def _page_semaphore(cls) -> asyncio.Semaphore:
+        """
+        Get the semaphore capping open pages on the running event loop.
+        
+        Shared by every adapter instance on the loop, sized by MAX_PAGES.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = cls._page_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = cls._page_semaphores[loop] = asyncio.Semaphore(cls.MAX_PAGES)
+        return semaphore
     
     def search(self, query: str, limit: int) -> List[Dict]:
         """
@@ -329,11 +772,112 @@ async def fetch_images(query: str, max_results: int = 50) -> List[Dict[str, str]
         return await adapter.fetch_images(query, max_results)
 
 
+class _SharedBrowser:
+    """
+    Long-lived browser resources running on a dedicated event loop thread.
+    
+    Lets synchronous callers reuse one Chromium instance across queries
+    instead of launching a new browser per call. Closed at interpreter exit.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._adapter: Optional[BrowserAdapter] = None
+    
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the event loop thread on first use."""
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="browser-adapter", daemon=True)
+                thread.start()
+                
+                # Keep this loop's browser open between calls; closed by close()
+                _browser_pools[loop] = BrowserPool(persistent=True)
+                self._loop, self._thread = loop, thread
+                atexit.register(self.close)
+            
+            return self._loop
+    
+    def _ensure_adapter(self) -> BrowserAdapter:
+        """Launch the shared adapter's browser on first use."""
+        loop = self._ensure_loop()
+        with self._lock:
+            if self._adapter is None:
+                adapter = BrowserAdapter()
+                asyncio.run_coroutine_threadsafe(adapter.__aenter__(), loop).result()
+                self._adapter = adapter
+            
+            return self._adapter
+    
+    def run(self, func: Callable[[BrowserAdapter], Awaitable[T]]) -> T:
+        """
+        Run a coroutine against the shared adapter and wait for its result.
+        
+        Args:
+            func: Callable taking the adapter and returning a coroutine
+            
+        Returns:
+            Result of the coroutine
+        """
+        adapter = self._ensure_adapter()
+        return asyncio.run_coroutine_threadsafe(func(adapter), self._loop).result()
+    
+    def run_coroutine(self, coro: Awaitable[T]) -> T:
+        """
+        Run a coroutine on the shared event loop and wait for its result.
+        
+        Adapters entered by coroutines run this way share the loop's
+        persistent browser pool, so one browser is reused across calls.
+        
+        Args:
+            coro: Coroutine to run
+            
+        Returns:
+            Result of the coroutine
+        """
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+    
+    async def _shutdown(self, adapter: Optional[BrowserAdapter]) -> None:
+        """Close the shared adapter and this loop's browser pool."""
+        try:
+            if adapter is not None:
+                await adapter.__aexit__(None, None, None)
+        finally:
+            await close_browser_pool()
+    
+    def close(self) -> None:
+        """Close the shared browsers and stop the event loop."""
+        with self._lock:
+            if self._loop is None:
+                return
+            
+            loop, thread, adapter = self._loop, self._thread, self._adapter
+            self._loop = self._thread = self._adapter = None
+        
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(adapter), loop).result(timeout=30)
+        except Exception:
+            pass
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=5)
+            loop.close()
+
+
+_shared_browser = _SharedBrowser()
+
+
 # Synchronous wrapper for compatibility with existing code
 def fetch_images_sync(query: str, max_results: int = 50) -> List[Dict[str, str]]:
     """
     Synchronous wrapper for fetch_images function.
     
+    Reuses a shared browser across calls; each call gets its own context.
+    
     Args:
         query: Search query string
         max_results: Maximum number of results to return
@@ -341,4 +885,4 @@ def fetch_images_sync(query: str, max_results: int = 50) -> List[Dict[str, str]]
     Returns:
         List of dictionaries with keys: url, id, source
     """
-    return asyncio.run(fetch_images(query, max_results))
+    return _shared_browser.run(lambda adapter: adapter.fetch_images(query, max_results))
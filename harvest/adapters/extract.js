@@ -0,0 +1,32 @@
+// Image extractor injected into browser contexts by BrowserAdapter.
+// Returns deduplicated images, skipping those known to be at most minW x minH,
+// at most `cap` of them (null for no cap), so only the final items cross the
+// browser bridge.
+window.__pvExtract = (minW, minH, cap) => {
+    const images = [];
+    const seen = new Set();
+    const imgElements = document.querySelectorAll('img[src], img[data-src], img[data-lazy-src]');
+
+    for (let index = 0; index < imgElements.length; index++) {
+        if (cap !== null && images.length >= cap) break;
+
+        const img = imgElements[index];
+        // Lazy-loaded images keep a data: placeholder in src, so take the first http(s) candidate
+        const src = [img.src, img.dataset.src, img.dataset.lazySrc].find(u => u && u.startsWith('http'));
+        if (!src || seen.has(src)) continue;
+
+        // Images may be blocked from loading, so fall back to declared size
+        const width = img.naturalWidth || parseInt(img.getAttribute('width')) || img.width;
+        const height = img.naturalHeight || parseInt(img.getAttribute('height')) || img.height;
+
+        // Filter out very small images (likely icons/buttons). A size of 0/NaN is
+        // unknown, e.g. a CSS-sized thumbnail with images and stylesheets blocked,
+        // so it passes; the downloader records the real dimensions.
+        if ((width && width <= minW) || (height && height <= minH)) continue;
+
+        seen.add(src);
+        images.push({url: src, id: `img_${index}_${Date.now()}`});
+    }
+
+    return images;
+};
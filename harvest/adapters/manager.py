@@ -3,17 +3,20 @@ Adapter manager for PixVault.
 Manages multiple image source adapters and provides a unified interface.
 """
 
-from typing import Dict, List, Optional, Any
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Any, Tuple
 from ..utils.logger import get_logger
+from . import get_adapter_class
 from .base import BaseAdapter
 
-# Import all adapters
-from .unsplash import UnsplashAdapter
-from .bing import BingAdapter
-from .pexels import PexelsAdapter
-
 logger = get_logger("harvest.adapters.manager")
 
+# Maximum number of (query, limit) entries kept in the search cache
+SEARCH_CACHE_SIZE = 128
+
 
 class AdapterManager:
     """
@@ -32,6 +35,11 @@ class AdapterManager:
         self.adapters: Dict[str, BaseAdapter] = {}
         self.sources = self.config.get('sources', ['unsplash'])
         
+        # Recent search_all results keyed by (query, limit_per_source)
+        self.search_cache_ttl = self.config.get('search_cache_ttl', 60)
+        self._search_cache: Dict[Tuple[str, int], Tuple[float, Dict[str, List[Dict]]]] = {}
+        self._search_cache_lock = threading.Lock()
+        
         # Initialize adapters
         self._initialize_adapters()
     
@@ -70,7 +78,7 @@ class AdapterManager:
                     logger.warning("Unsplash access key not configured")
                     return None
                 adapter_config['api_key'] = api_config['access_key']
-                return UnsplashAdapter(adapter_config)
+                return get_adapter_class('unsplash')(adapter_config)
             
             elif source == 'bing':
                 api_config = self.config.get('apis', {}).get('bing', {})
@@ -78,7 +86,7 @@ class AdapterManager:
                     logger.warning("Bing API key not configured")
                     return None
                 adapter_config['api_key'] = api_config['api_key']
-                return BingAdapter(adapter_config)
+                return get_adapter_class('bing')(adapter_config)
             
             elif source == 'pexels':
                 api_config = self.config.get('apis', {}).get('pexels', {})
@@ -86,7 +94,7 @@ class AdapterManager:
                     logger.warning("Pexels API key not configured")
                     return None
                 adapter_config['api_key'] = api_config['api_key']
-                return PexelsAdapter(adapter_config)
+                return get_adapter_class('pexels')(adapter_config)
             
             else:
                 logger.warning(f"Unknown source: {source}")
@@ -121,6 +129,9 @@ class AdapterManager:
         """
         Search all available adapters for images.
         
+        Results are cached for search_cache_ttl seconds, so follow-up calls
+        (stats, totals, downloads) for the same query don't hit the APIs again.
+        
         Args:
             query: Search query string
             limit_per_source: Maximum results per source
@@ -128,21 +139,132 @@ class AdapterManager:
         Returns:
             Dictionary mapping source names to their search results
         """
-        results = {}
+        key = (query, limit_per_source)
+        cached = self._get_cached_search(key)
+        if cached is not None:
+            logger.debug(f"Using cached search results for: {query}")
+            return cached
         
-        for source, adapter in self.adapters.items():
-            try:
+        # Pre-fill in adapter order so the result ordering doesn't depend on completion order
+        results = {source: [] for source in self.adapters}
+        
+        if not self.adapters:
+            return results
+        
+        # Each search is a blocking HTTP call, so fan out one thread per source
+        with ThreadPoolExecutor(max_workers=len(self.adapters)) as executor:
+            futures = {}
+            for source, adapter in self.adapters.items():
                 logger.info(f"Searching {source} for: {query}")
-                source_results = adapter.search(query, limit_per_source)
-                results[source] = source_results
-                logger.info(f"Found {len(source_results)} images from {source}")
-                
-            except Exception as e:
-                logger.error(f"Error searching {source}: {e}")
+                futures[executor.submit(adapter.search, query, limit_per_source)] = source
+            
+            for future in as_completed(futures):
+                source = futures[future]
+                try:
+                    source_results = future.result() or []
+                    results[source] = source_results
+                    logger.info(f"Found {len(source_results)} images from {source}")
+                    
+                except Exception as e:
+                    logger.error(f"Error searching {source}: {e}")
+                    results[source] = []
+        
+        self._store_complete_search(key, results)
+        
+        return results
+    
+    async def search_all_async(self, query: str, limit_per_source: int = 10) -> Dict[str, List[Dict]]:
+        """
+        Search all available adapters concurrently from an event loop.
+        
+        Adapters with a native search_async (e.g. Pexels) share the loop's
+        HTTP/2 connections; the others run their blocking search in a thread.
+        Shares the search_all result cache.
+        
+        Args:
+            query: Search query string
+            limit_per_source: Maximum results per source
+            
+        Returns:
+            Dictionary mapping source names to their search results
+        """
+        key = (query, limit_per_source)
+        cached = self._get_cached_search(key)
+        if cached is not None:
+            logger.debug(f"Using cached search results for: {query}")
+            return cached
+        
+        sources = list(self.adapters)
+        coros = []
+        for source in sources:
+            adapter = self.adapters[source]
+            logger.info(f"Searching {source} for: {query}")
+            search_async = getattr(adapter, 'search_async', None)
+            if search_async is not None:
+                coros.append(search_async(query, limit_per_source))
+            else:
+                coros.append(asyncio.to_thread(adapter.search, query, limit_per_source))
+        
+        results = {}
+        for source, outcome in zip(sources, await asyncio.gather(*coros, return_exceptions=True)):
+            if isinstance(outcome, Exception):
+                logger.error(f"Error searching {source}: {outcome}")
                 results[source] = []
+            else:
+                results[source] = outcome or []
+                logger.info(f"Found {len(results[source])} images from {source}")
+        
+        self._store_complete_search(key, results)
         
         return results
     
+    def _get_cached_search(self, key: Tuple[str, int]) -> Optional[Dict[str, List[Dict]]]:
+        """Return a copy of unexpired cached search results, or None."""
+        if self.search_cache_ttl <= 0:
+            return None
+        
+        with self._search_cache_lock:
+            entry = self._search_cache.get(key)
+            if entry is None:
+                return None
+            
+            stored_at, results = entry
+            if time.monotonic() - stored_at > self.search_cache_ttl:
+                del self._search_cache[key]
+                return None
+        
+        return {source: list(items) for source, items in results.items()}
+    
+    def _store_complete_search(self, key: Tuple[str, int], results: Dict[str, List[Dict]]) -> None:
+        """
+        Cache search results only if every source returned something.
+        
+        Adapters log and swallow their own errors (rate limits, outages) and
+        return [], so an empty source is treated as a failure: caching it would
+        hide that source until the TTL expires instead of letting a retry reach it.
+        """
+        if all(results.values()):
+            self._store_cached_search(key, results)
+        else:
+            empty = [source for source, items in results.items() if not items]
+            logger.debug(f"Not caching search results; no results from: {', '.join(empty)}")
+    
+    def _store_cached_search(self, key: Tuple[str, int], results: Dict[str, List[Dict]]) -> None:
+        """Cache search results, evicting the oldest entry when full."""
+        if self.search_cache_ttl <= 0:
+            return
+        
+        with self._search_cache_lock:
+            self._search_cache.pop(key, None)
+            if len(self._search_cache) >= SEARCH_CACHE_SIZE:
+                del self._search_cache[next(iter(self._search_cache))]
+            self._search_cache[key] = (time.monotonic(), {source: list(items) for source, items in results.items()})
+    
+    def clear_search_cache(self) -> None:
+        """Drop all cached search results."""
+        with self._search_cache_lock:
+            self._search_cache.clear()
+    
     def download_from_all(self, query: str, output_dir: str, limit_per_source: int = 5) -> Dict[str, List[str]]:
         """
         Search and download from all available sources.
@@ -156,6 +278,7 @@ class AdapterManager:
             Dictionary mapping source names to lists of downloaded file paths
         """
         downloaded_files = {}
+        max_workers = self.config.get('download', {}).get('max_concurrent', 5)
         
         # Search all sources
         search_results = self.search_all(query, limit_per_source)
@@ -173,14 +296,20 @@ class AdapterManager:
             
             logger.info(f"Downloading {len(results)} images from {source}")
             
-            for item in results:
-                try:
-                    file_path = adapter.download(item, output_dir)
-                    downloaded_files[source].append(file_path)
-                    logger.info(f"Downloaded: {file_path}")
-                    
-                except Exception as e:
-                    logger.error(f"Error downloading from {source}: {e}")
+            # Bind the concrete download method once for the whole batch
+            download = adapter.download
+            
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(results))) as executor:
+                futures = [executor.submit(download, item, output_dir) for item in results]
+                
+                for future in as_completed(futures):
+                    try:
+                        file_path = future.result()
+                        downloaded_files[source].append(file_path)
+                        logger.info(f"Downloaded: {file_path}")
+                        
+                    except Exception as e:
+                        logger.error(f"Error downloading from {source}: {e}")
         
         return downloaded_files
     
@@ -6,11 +6,68 @@ Uses Pexels API to find and download high-quality images.
 import os
 import uuid
 import hashlib
-from typing import List, Dict
+from functools import lru_cache
+from typing import List, Dict, Optional
 from urllib.parse import urlparse
 from ..utils.http_client import get_http_client
+from ..utils.json_utils import response_json
 from .base import BaseAdapter
 
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Recognized image extensions in download URLs
+_IMAGE_EXTS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp', '.tiff', '.svg'})
+
+# Content-type subtypes mapped to file extensions
+_CT_MAP = {
+    'jpeg': '.jpg',
+    'jpg': '.jpg',
+    'pjpeg': '.jpg',
+    'png': '.png',
+    'gif': '.gif',
+    'webp': '.webp',
+    'svg+xml': '.svg',
+    'svg': '.svg',
+    'bmp': '.bmp',
+    'x-ms-bmp': '.bmp',
+    'tiff': '.tiff',
+}
+
+
+@lru_cache(maxsize=64)
+def _lookup_extension(suffix: str, content_type: Optional[str] = None) -> str:
+    """
+    Map a URL path suffix and content type to a file extension.
+    
+    Cached on the suffix rather than the full URL, since Pexels only serves
+    a handful of formats and every photo has a distinct path.
+    
+    Args:
+        suffix: Path suffix as returned by os.path.splitext (e.g. ".JPEG" or "")
+        content_type: HTTP content type header
+        
+    Returns:
+        File extension (including the dot)
+    """
+    # Try to get extension from URL
+    ext = suffix.lower()
+    if ext in _IMAGE_EXTS:
+        return ext
+    
+    # Try to get extension from content type subtype (e.g. "image/svg+xml; charset=utf-8")
+    if content_type:
+        subtype = content_type.split(';', 1)[0].strip().lower().rpartition('/')[2]
+        ext = _CT_MAP.get(subtype)
+        if ext:
+            return ext
+    
+    # Default to .jpg if we can't determine (Pexels typically serves JPEG)
+    return '.jpg'
+
 
 class PexelsAdapter(BaseAdapter):
     """
@@ -30,6 +87,7 @@ class PexelsAdapter(BaseAdapter):
             raise ValueError("Pexels API key is required in config")
         
         self.base_url = "https://api.pexels.com/v1/search"
+        self.photo_url = "https://api.pexels.com/v1/photos"
         
         # Initialize HTTP client
         self.http_client = get_http_client(self.config.get('http_client', {}))
@@ -43,62 +101,153 @@ class PexelsAdapter(BaseAdapter):
             limit: Maximum number of results to return
             
         Returns:
-            List of dictionaries containing image metadata with keys: url, id, source, title, width, height
+            List of dictionaries containing image metadata with keys: url, id, source, title, width, height.
+            The raw Pexels ``src`` mapping is kept under ``_src`` for get_image_variants; use
+            get_full_metadata for photographer details.
         """
-        params = {
-            "query": query,
-            "per_page": min(limit, 80),  # Pexels API max is 80 per request
-            "page": 1,
-            "orientation": "all",
-            "size": "all",
-            "color": "all"
-        }
+        if IJSON_AVAILABLE:
+            try:
+                return self._stream_search(query, limit)
+            except Exception as e:
+                self.logger.warning(f"Streaming Pexels search failed, retrying buffered: {e}")
         
         try:
-            # Prepare headers with API key
-            headers = {
-                "Authorization": self.api_key
-            }
-            
             # Use centralized HTTP client with User-Agent rotation and proxy support
-            response = self.http_client.get(self.base_url, headers=headers, params=params)
+            response = self.http_client.get(self.base_url, headers=self._auth_headers(),
+                                            params=self._search_params(query, limit))
             
-            data = response.json()
-            results = []
+            return self._parse_search_response(response, query, limit)
+            
+        except Exception as e:
+            self.logger.error(f"Error occurred while searching Pexels: {e}")
+            return []
+    
+    def _stream_search(self, query: str, limit: int) -> List[Dict]:
+        """
+        Search Pexels, parsing photos incrementally as the response arrives.
+        
+        Photos are emitted by ijson while the body is still downloading and
+        the transfer stops once ``limit`` results have been collected.
+        
+        Args:
+            query: Search query string
+            limit: Maximum number of results to return
             
-            for photo in data.get("photos", []):
-                # Extract image metadata
-                result = {
-                    "url": photo.get("src", {}).get("large2x", ""),  # High quality image
-                    "id": self._generate_image_id(photo),
-                    "source": "pexels",
-                    "title": photo.get("alt", ""),
-                    "width": photo.get("width"),
-                    "height": photo.get("height"),
-                    "photographer": photo.get("photographer", ""),
-                    "photographer_url": photo.get("photographer_url", ""),
-                    "photographer_id": photo.get("photographer_id"),
-                    "avg_color": photo.get("avg_color", ""),
-                    "liked": photo.get("liked", False),
-                    "thumbnail": photo.get("src", {}).get("medium", ""),
-                    "small": photo.get("src", {}).get("small", ""),
-                    "original": photo.get("src", {}).get("original", ""),
-                    "large": photo.get("src", {}).get("large", ""),
-                    "portrait": photo.get("src", {}).get("portrait", ""),
-                    "landscape": photo.get("src", {}).get("landscape", "")
-                }
+        Returns:
+            List of result dictionaries
+        """
+        results = []
+        photos = ijson.sendable_list()
+        parser = ijson.items_coro(photos, 'photos.item', use_float=True)
+        
+        with self.http_client.stream('GET', self.base_url, headers=self._auth_headers(),
+                                     params=self._search_params(query, limit)) as response:
+            for chunk in response.iter_bytes():
+                parser.send(chunk)
+                
+                for photo in photos:
+                    result = self._photo_to_result(photo)
+                    if result["url"]:
+                        results.append(result)
+                del photos[:]
                 
-                # Only include images with valid URLs
-                if result["url"]:
-                    results.append(result)
+                if len(results) >= limit:
+                    break
+            else:
+                parser.close()
+        
+        self.logger.info(f"Successfully retrieved {len(results)} images from Pexels for query: {query}")
+        return results[:limit]
+    
+    async def search_async(self, query: str, limit: int) -> List[Dict]:
+        """
+        Search for images using Pexels API without blocking the event loop.
+        
+        Concurrent calls on the same loop share one pooled HTTP/2 connection.
+        
+        Args:
+            query: Search query string
+            limit: Maximum number of results to return
+            
+        Returns:
+            Same results as search()
+        """
+        try:
+            response = await self.http_client.aget(self.base_url, headers=self._auth_headers(),
+                                                   params=self._search_params(query, limit))
             
-            self.logger.info(f"Successfully retrieved {len(results)} images from Pexels for query: {query}")
-            return results[:limit]
+            return self._parse_search_response(response, query, limit)
             
         except Exception as e:
             self.logger.error(f"Error occurred while searching Pexels: {e}")
             return []
     
+    def _auth_headers(self) -> Dict[str, str]:
+        """Headers carrying the Pexels API key."""
+        return {
+            "Authorization": self.api_key
+        }
+    
+    def _search_params(self, query: str, limit: int) -> Dict:
+        """Query parameters for a Pexels search request."""
+        return {
+            "query": query,
+            "per_page": min(limit, 80),  # Pexels API max is 80 per request
+            "page": 1,
+            "orientation": "all",
+            "size": "all",
+            "color": "all"
+        }
+    
+    def _parse_search_response(self, response, query: str, limit: int) -> List[Dict]:
+        """
+        Convert a Pexels search response into result dictionaries.
+        
+        Args:
+            response: httpx Response from the search endpoint
+            query: Search query string (for logging)
+            limit: Maximum number of results to return
+            
+        Returns:
+            List of result dictionaries
+        """
+        data = response_json(response)
+        results = []
+        
+        for photo in data.get("photos", []):
+            result = self._photo_to_result(photo)
+            
+            # Only include images with valid URLs
+            if result["url"]:
+                results.append(result)
+        
+        self.logger.info(f"Successfully retrieved {len(results)} images from Pexels for query: {query}")
+        return results[:limit]
+    
+    def _photo_to_result(self, photo: Dict) -> Dict:
+        """
+        Build a search result from a Pexels photo object.
+        
+        Args:
+            photo: Photo object from the Pexels API
+            
+        Returns:
+            Result dictionary
+        """
+        src = photo.get("src", {})
+        
+        # Extract only the fields used downstream; size variants stay in the
+        # response's own src mapping
+        return {
+            "url": src.get("large2x", ""),  # High quality image
+            "id": self._generate_image_id(photo),
+            "source": "pexels",
+            "title": photo.get("alt", ""),
+            "width": photo.get("width"),
+            "height": photo.get("height"),
+            "_src": src
+        }
+    
     def download(self, item: Dict, output_dir: str) -> str:
         """
         Download an image from Pexels search results.
@@ -142,7 +291,7 @@ class PexelsAdapter(BaseAdapter):
         # Generate ID based on URL hash
         url = photo_data.get("src", {}).get("large2x", "")
         if url:
-            url_hash = hashlib.md5(url.encode()).hexdigest()[:12]
+            url_hash = hashlib.blake2b(url.encode(), digest_size=6).hexdigest()
             return f"pexels_{url_hash}"
         
         # Fallback to UUID
@@ -172,7 +321,7 @@ class PexelsAdapter(BaseAdapter):
             base_name = f"pexels_{uuid.uuid4().hex[:12]}"
         
         # Add content hash for additional uniqueness
-        url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
+        url_hash = hashlib.blake2b(url.encode(), digest_size=4).hexdigest()
         filename = f"{base_name}_{url_hash}{extension}"
         
         # Sanitize filename
@@ -190,37 +339,41 @@ class PexelsAdapter(BaseAdapter):
         Returns:
             File extension (including the dot)
         """
-        # Try to get extension from URL
-        parsed_url = urlparse(url)
-        path = parsed_url.path.lower()
-        
-        # Common image extensions
-        image_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp', '.tiff', '.svg']
-        
-        for ext in image_extensions:
-            if path.endswith(ext):
-                return ext
-        
-        # Try to get extension from content type
-        if content_type:
-            content_type = content_type.lower()
-            if 'jpeg' in content_type or 'jpg' in content_type:
-                return '.jpg'
-            elif 'png' in content_type:
-                return '.png'
-            elif 'gif' in content_type:
-                return '.gif'
-            elif 'webp' in content_type:
-                return '.webp'
-            elif 'svg' in content_type:
-                return '.svg'
-            elif 'bmp' in content_type:
-                return '.bmp'
-            elif 'tiff' in content_type:
-                return '.tiff'
-        
-        # Default to .jpg if we can't determine (Pexels typically serves JPEG)
-        return '.jpg'
+        return _lookup_extension(os.path.splitext(urlparse(url).path)[1], content_type)
+    
+    def get_full_metadata(self, item: Dict) -> Dict:
+        """
+        Fetch the full Pexels metadata for a search result.
+        
+        Search results only carry the fields needed for downloading; this
+        looks the photo up again to get photographer and color details.
+        
+        Args:
+            item: Image metadata dictionary (from search results)
+            
+        Returns:
+            Dictionary with photographer, photographer_url, photographer_id,
+            avg_color and liked, or an empty dictionary if unavailable
+        """
+        pexels_id = item.get("id", "").removeprefix("pexels_")
+        if not pexels_id.isdigit():
+            return {}
+        
+        try:
+            response = self.http_client.get(f"{self.photo_url}/{pexels_id}", headers=self._auth_headers())
+            photo = response_json(response)
+            
+            return {
+                "photographer": photo.get("photographer", ""),
+                "photographer_url": photo.get("photographer_url", ""),
+                "photographer_id": photo.get("photographer_id"),
+                "avg_color": photo.get("avg_color", ""),
+                "liked": photo.get("liked", False)
+            }
+            
+        except Exception as e:
+            self.logger.error(f"Error occurred while fetching Pexels photo {pexels_id}: {e}")
+            return {}
     
     def get_photographer_info(self, item: Dict) -> Dict:
         """
@@ -232,10 +385,11 @@ class PexelsAdapter(BaseAdapter):
         Returns:
             Dictionary with photographer information
         """
+        metadata = item if "photographer" in item else self.get_full_metadata(item)
         return {
-            "name": item.get("photographer", ""),
-            "url": item.get("photographer_url", ""),
-            "id": item.get("photographer_id", "")
+            "name": metadata.get("photographer", ""),
+            "url": metadata.get("photographer_url", ""),
+            "id": metadata.get("photographer_id", "")
         }
     
     def get_image_variants(self, item: Dict) -> Dict:
@@ -248,12 +402,13 @@ class PexelsAdapter(BaseAdapter):
         Returns:
             Dictionary with different image size URLs
         """
+        src = item.get("_src", {})
         return {
-            "original": item.get("original", ""),
+            "original": src.get("original", ""),
             "large2x": item.get("url", ""),  # This is what we use for download
-            "large": item.get("large", ""),
-            "medium": item.get("thumbnail", ""),
-            "small": item.get("small", ""),
-            "portrait": item.get("portrait", ""),
-            "landscape": item.get("landscape", "")
+            "large": src.get("large", ""),
+            "medium": src.get("medium", ""),
+            "small": src.get("small", ""),
+            "portrait": src.get("portrait", ""),
+            "landscape": src.get("landscape", "")
         }
@@ -1,6 +1,7 @@
 import os
 from typing import List, Dict
 from ..utils.http_client import get_http_client
+from ..utils.json_utils import response_json
 from .base import BaseAdapter
 
 
@@ -9,6 +10,8 @@ class UnsplashAdapter(BaseAdapter):
     Unsplash adapter for searching and downloading images from Unsplash API.
     """
     
+    __slots__ = ('api_key', 'base_url')
+    
     def __init__(self, config: Dict = None):
         """
         Initialize the Unsplash adapter.
@@ -21,6 +24,8 @@ class UnsplashAdapter(BaseAdapter):
         if not self.api_key:
             raise ValueError("Unsplash API key is required in config")
         
+        self.base_url = "https://api.unsplash.com/search/photos"
+        
         # Initialize HTTP client
         self.http_client = get_http_client(self.config.get('http_client', {}))
     
@@ -35,36 +40,81 @@ class UnsplashAdapter(BaseAdapter):
         Returns:
             List of dictionaries containing image data with keys: url, id, source, title, width, height
         """
-        url = f"https://api.unsplash.com/search/photos?query={query}&per_page={limit}"
-        headers = {
-            "Authorization": f"Client-ID {self.api_key}"
-        }
-        
         try:
             # Use centralized HTTP client with User-Agent rotation and proxy support
-            response = self.http_client.get(url, headers=headers)
+            response = self.http_client.get(self.base_url, headers=self._auth_headers(),
+                                            params=self._search_params(query, limit))
             
-            data = response.json()
-            results = []
+            return self._parse_search_response(response, query)
             
-            for photo in data.get("results", []):
-                result = {
-                    "url": photo.get("urls", {}).get("regular", ""),
-                    "id": photo.get("id", ""),
-                    "source": "unsplash",
-                    "title": photo.get("alt_description", ""),
-                    "width": photo.get("width"),
-                    "height": photo.get("height")
-                }
-                results.append(result)
+        except Exception as e:
+            self.logger.error(f"Error occurred while searching Unsplash: {e}")
+            return []
+    
+    async def search_async(self, query: str, limit: int) -> List[Dict]:
+        """
+        Search for images on Unsplash without blocking the event loop.
+        
+        Lets Unsplash API latency overlap with other async work such as
+        browser scraping; concurrent calls share pooled HTTP/2 connections.
+        
+        Args:
+            query: Search query string
+            limit: Maximum number of results to return
+            
+        Returns:
+            Same results as search()
+        """
+        try:
+            response = await self.http_client.aget(self.base_url, headers=self._auth_headers(),
+                                                   params=self._search_params(query, limit))
             
-            self.logger.info(f"Successfully retrieved {len(results)} images from Unsplash for query: {query}")
-            return results
+            return self._parse_search_response(response, query)
             
         except Exception as e:
             self.logger.error(f"Error occurred while searching Unsplash: {e}")
             return []
     
+    def _auth_headers(self) -> Dict[str, str]:
+        """Headers carrying the Unsplash access key."""
+        return {
+            "Authorization": f"Client-ID {self.api_key}"
+        }
+    
+    def _search_params(self, query: str, limit: int) -> Dict:
+        """Query parameters for an Unsplash search request."""
+        return {
+            "query": query,
+            "per_page": limit
+        }
+    
+    def _parse_search_response(self, response, query: str) -> List[Dict]:
+        """
+        Convert an Unsplash search response into result dictionaries.
+        
+        Args:
+            response: httpx Response from the search endpoint
+            query: Search query string (for logging)
+            
+        Returns:
+            List of result dictionaries
+        """
+        data = response_json(response)
+        results = [
+            {
+                "url": (photo.get("urls") or {}).get("regular", ""),
+                "id": photo.get("id", ""),
+                "source": "unsplash",
+                "title": photo.get("alt_description", ""),
+                "width": photo.get("width"),
+                "height": photo.get("height")
+            }
+            for photo in data.get("results", ())
+        ]
+        
+        self.logger.info(f"Successfully retrieved {len(results)} images from Unsplash for query: {query}")
+        return results
+    
     def download(self, item: Dict, output_dir: str) -> str:
         """
         Download an image from Unsplash.
@@ -90,6 +140,10 @@ class UnsplashAdapter(BaseAdapter):
             raise RuntimeError(f"Failed to download image from {url}")
 
 
+# Adapters used by search_unsplash, keyed by API key
+_LEGACY_ADAPTERS: Dict[str, UnsplashAdapter] = {}
+
+
 # Legacy function for backward compatibility
 def search_unsplash(query: str, per_page: int, api_key: str) -> List[Dict[str, str]]:
     """
@@ -104,16 +158,19 @@ def search_unsplash(query: str, per_page: int, api_key: str) -> List[Dict[str, s
     Returns:
         List of dictionaries containing image data with keys: url, id, source
     """
-    adapter = UnsplashAdapter({'api_key': api_key})
+    # Reuse one adapter (and its HTTP client) per API key across calls
+    adapter = _LEGACY_ADAPTERS.get(api_key)
+    if adapter is None:
+        adapter = _LEGACY_ADAPTERS[api_key] = UnsplashAdapter({'api_key': api_key})
+    
     results = adapter.search(query, per_page)
     
     # Convert to legacy format
-    legacy_results = []
-    for result in results:
-        legacy_results.append({
+    return [
+        {
             "url": result.get("url", ""),
             "id": result.get("id", ""),
             "source": result.get("source", "unsplash")
-        })
-    
-    return legacy_results
\ No newline at end of file
+        }
+        for result in results
+    ]
\ No newline at end of file
@@ -3,26 +3,335 @@ Backup and archiving module for PixVault.
 Provides secure backup, restore, and archiving functionality for images and metadata.
 """
 
+import errno
+import fnmatch
 import os
+import re
 import shutil
 import sqlite3
+import stat
+import subprocess
 import json
 import gzip
 import tarfile
 import hashlib
+import hmac
+import heapq
+import mmap
+import sys
+import threading
 import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, List, Optional, Tuple, Union
+from dataclasses import dataclass, asdict, field, fields
+from operator import attrgetter
 import logging
 
 from .config import load_config
 from .db import Database
 from .utils.logger import get_logger
 
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from isal import igzip
+    ISAL_AVAILABLE = True
+except ImportError:
+    ISAL_AVAILABLE = False
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 logger = get_logger("harvest.backup")
 
+# Read size for the checksum fallback when hashlib.file_digest is unavailable
+CHECKSUM_CHUNK_SIZE = 1024 * 1024
+
+# Directory checksums of more files than this are hashed in worker processes,
+# since per-file overhead on small files keeps threads contending for the GIL
+PROCESS_HASH_THRESHOLD = 10000
+
+# Archive file name per compression format
+ARCHIVE_NAMES = {
+    'zstd': 'storage_backup.tar.zst',
+    'gzip': 'storage_backup.tar.gz',
+}
+
+# Archives are restored as one sequential stream in blocks of this size
+RESTORE_BUFFER_SIZE = 1024 * 1024
+
+# The 'data' extraction filter rejects absolute paths, '..' components, links
+# leaving the destination and special files; available since Python 3.12 and
+# in security releases of 3.8-3.11
+TAR_EXTRACT_OPTIONS = {'filter': 'data'} if hasattr(tarfile, 'data_filter') else {}
+
+# Linux ioctl that clones a file's extents (_IOW(0x94, 9, int)); supported by
+# copy-on-write filesystems such as Btrfs and XFS
+FICLONE = 0x40049409
+
+# Applied to every backup metadata connection: WAL lets readers run alongside
+# the writer, and NORMAL sync is crash-safe in WAL mode without an fsync per commit
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",  # 64 MiB
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+    "PRAGMA busy_timeout=60000",
+)
+
+# Tags stored in front of checksum digests; untagged digests are SHA256
+CHECKSUM_PREFIXES = {
+    'blake3': 'b3:',
+    'blake2b': 'b2:',
+    'sha256': '',
+}
+
+
+def resolve_checksum_algorithm(algorithm: Optional[str] = None) -> str:
+    """
+    Pick the checksum algorithm to use.
+    
+    Backup checksums are integrity tags rather than adversarial hashes, so the
+    default is BLAKE3 when installed and BLAKE2b (in hashlib) otherwise.
+    
+    Args:
+        algorithm: Requested algorithm, or None for the default
+        
+    Returns:
+        Algorithm name usable on this system
+    """
+    if algorithm is None or (algorithm == 'blake3' and not BLAKE3_AVAILABLE):
+        return 'blake3' if BLAKE3_AVAILABLE else 'blake2b'
+    if algorithm not in CHECKSUM_PREFIXES:
+        raise ValueError(f"Unsupported checksum algorithm: {algorithm}")
+    return algorithm
+
+
+def checksum_algorithm_of(checksum: str) -> str:
+    """Return the algorithm a stored checksum was computed with."""
+    for algorithm, prefix in CHECKSUM_PREFIXES.items():
+        if prefix and checksum.startswith(prefix):
+            return algorithm
+    return 'sha256'
+
+
+def _write_all(fd: int, data) -> None:
+    """Write all of data to a raw file descriptor, retrying on short writes."""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _copy_fd(in_fd: int, out_fd: int, count: int) -> None:
+    """
+    Copy count bytes between file descriptors, in the kernel where possible.
+    
+    Uses os.sendfile (which accepts a pipe as output on Linux) and falls back
+    to a read/write loop where sendfile is unavailable or unsupported.
+    
+    Raises:
+        OSError: If the source ends before count bytes were copied
+    """
+    offset = 0
+    if hasattr(os, 'sendfile'):
+        try:
+            while offset < count:
+                sent = os.sendfile(out_fd, in_fd, offset, count - offset)
+                if sent == 0:
+                    raise OSError(f"File shrank during backup ({offset} of {count} bytes)")
+                offset += sent
+            return
+        except OSError as e:
+            if e.errno not in (errno.EINVAL, errno.ENOSYS, errno.ENOTSOCK, errno.EOPNOTSUPP):
+                raise
+    
+    os.lseek(in_fd, offset, os.SEEK_SET)
+    while offset < count:
+        chunk = os.read(in_fd, min(CHECKSUM_CHUNK_SIZE, count - offset))
+        if not chunk:
+            raise OSError(f"File shrank during backup ({offset} of {count} bytes)")
+        _write_all(out_fd, chunk)
+        offset += len(chunk)
+
+
+def compile_exclude_patterns(patterns: List[str]) -> Optional[re.Pattern]:
+    """
+    Compile glob exclude patterns into one regex matched against file names.
+    
+    Args:
+        patterns: Glob patterns such as '*.tmp' or '__pycache__'
+        
+    Returns:
+        Compiled alternation of all patterns, or None if there are none
+    """
+    if not patterns:
+        return None
+    return re.compile('|'.join(f'(?:{fnmatch.translate(pattern)})' for pattern in patterns))
+
+
+def _cow_copy(src: str, dst: str) -> str:
+    """
+    Copy a file with metadata, cloning it instead where the filesystem allows.
+    
+    On copy-on-write filesystems the FICLONE ioctl shares the source's extents,
+    so no data is moved. Elsewhere this falls back to shutil.copyfile, which
+    uses sendfile on Linux.
+    
+    Args:
+        src: Source file path
+        dst: Destination file path
+        
+    Returns:
+        Destination path (as required of a copytree copy_function)
+    """
+    cloned = False
+    if fcntl is not None and sys.platform.startswith('linux'):
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            try:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+                cloned = True
+            except OSError as e:
+                # Not a CoW filesystem, different filesystems, or unsupported file
+                if e.errno not in (errno.EOPNOTSUPP, errno.EXDEV, errno.EINVAL,
+                                   errno.ENOTTY, errno.ENOSYS, errno.EPERM):
+                    raise
+    
+    if not cloned:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
+
+def _file_hexdigest(file_path: str, algorithm: str) -> str:
+    """Hash a file's contents with the given algorithm."""
+    if algorithm == 'blake3':
+        # SIMD and multithreaded tree hashing over the library's own mapping
+        file_hash = blake3.blake3(max_threads=blake3.blake3.AUTO)
+        file_hash.update_mmap(file_path)
+        return file_hash.hexdigest()
+    
+    with open(file_path, "rb", buffering=0) as f:
+        # Hash a read-only mapping in one call so OpenSSL's SHA-NI/AVX2
+        # code sees one contiguous buffer. Empty files can't be mapped,
+        # and 32-bit builds can't map files past their address space.
+        size = os.fstat(f.fileno()).st_size
+        if hasattr(os, 'posix_fadvise'):
+            # One front-to-back pass: let the kernel read ahead aggressively
+            try:
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass
+        if 0 < size <= sys.maxsize:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mm, 'madvise'):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    file_hash = _new_hash(algorithm)
+                    file_hash.update(mm)
+                    return file_hash.hexdigest()
+            except (OSError, ValueError):
+                # Not mappable (e.g. pipes, some network filesystems)
+                pass
+        
+        try:
+            # Python 3.11+: read and hash loop runs entirely in C
+            return hashlib.file_digest(f, lambda: _new_hash(algorithm)).hexdigest()
+        except AttributeError:
+            # Read into one reusable buffer; the file is unbuffered, so
+            # there is no extra copy and no allocation per block
+            file_hash = _new_hash(algorithm)
+            buffer = bytearray(CHECKSUM_CHUNK_SIZE)
+            view = memoryview(buffer)
+            while True:
+                read_size = f.readinto(buffer)
+                if not read_size:
+                    break
+                file_hash.update(view[:read_size])
+            return file_hash.hexdigest()
+
+
+def _hash_file_shard(paths: List[str], algorithm: str) -> List[Tuple[str, str]]:
+    """
+    Hash a shard of files in a worker process.
+    
+    Args:
+        paths: Files to hash
+        algorithm: Checksum algorithm
+        
+    Returns:
+        List of (path, tagged checksum) tuples; checksum is "" on failure
+    """
+    results = []
+    for path in paths:
+        try:
+            results.append((path, CHECKSUM_PREFIXES[algorithm] + _file_hexdigest(path, algorithm)))
+        except Exception as e:
+            logger.error(f"Failed to calculate checksum for {path}: {e}")
+            results.append((path, ""))
+    return results
+
+
+def _partition_by_size(paths: List[str], sizes, shard_count: int) -> List[List[str]]:
+    """
+    Split files into shards of similar total size (greedy longest-processing-time).
+    
+    Args:
+        paths: File paths
+        sizes: File sizes, parallel to paths
+        shard_count: Number of shards to produce
+        
+    Returns:
+        Non-empty shards of paths
+    """
+    shards: List[List[str]] = [[] for _ in range(shard_count)]
+    loads = [(0, index) for index in range(shard_count)]
+    for size, path in sorted(zip(sizes, paths), reverse=True):
+        load, index = heapq.heappop(loads)
+        shards[index].append(path)
+        heapq.heappush(loads, (load + size, index))
+    return [shard for shard in shards if shard]
+
+
+# Empty hash objects per algorithm, copied instead of constructed per use
+_HASH_PROTOTYPES: Dict[str, Any] = {}
+
+
+def _new_hash(algorithm: str):
+    """
+    Create an empty hash object for a checksum algorithm.
+    
+    Copies a cached empty instance, which skips hashlib.new's name lookup
+    and constructor dispatch on every file of a tree checksum.
+    """
+    prototype = _HASH_PROTOTYPES.get(algorithm)
+    if prototype is None:
+        prototype = blake3.blake3() if algorithm == 'blake3' else hashlib.new(algorithm)
+        _HASH_PROTOTYPES[algorithm] = prototype
+    return prototype.copy()
+
 
 @dataclass
 class BackupMetadata:
@@ -43,6 +352,80 @@ class BackupMetadata:
     expires_at: Optional[str] = None
 
 
+@dataclass
+class TreeEntries:
+    """
+    Files found by one directory scan, stored as parallel columns.
+    
+    Sizes and mtimes (in nanoseconds) are packed int64 arrays, so totals
+    and comparisons don't go through per-file objects.
+    """
+    paths: List[str] = field(default_factory=list)
+    sizes: array = field(default_factory=lambda: array('q'))
+    mtimes: array = field(default_factory=lambda: array('q'))
+    
+    def __len__(self) -> int:
+        return len(self.paths)
+    
+    @property
+    def total_size(self) -> int:
+        """Combined size of all files in bytes."""
+        if NUMPY_AVAILABLE:
+            # Zero-copy view of the packed sizes, summed in C
+            return int(np.frombuffer(self.sizes, dtype=np.int64).sum())
+        return sum(self.sizes)
+
+
+class HashingWriter:
+    """
+    File wrapper that hashes everything written through it.
+    
+    Lets an archive be checksummed in the same pass that writes it.
+    """
+    
+    __slots__ = ('fileobj', 'hash', 'size')
+    
+    def __init__(self, fileobj, algorithm: str):
+        self.fileobj = fileobj
+        self.hash = _new_hash(algorithm)
+        self.size = 0
+    
+    @property
+    def name(self):
+        """Underlying file name (used by gzip for its header)."""
+        return getattr(self.fileobj, 'name', '')
+    
+    def write(self, data) -> int:
+        """Hash and write data to the underlying file."""
+        self.hash.update(data)
+        written = self.fileobj.write(data)
+        self.size += len(data)
+        return written
+    
+    def flush(self):
+        """Flush the underlying file."""
+        self.fileobj.flush()
+    
+    def hexdigest(self) -> str:
+        """Hex digest of everything written so far."""
+        return self.hash.hexdigest()
+
+
+# Row values in backup_metadata column order, which matches the field order
+_metadata_row = attrgetter(*(metadata_field.name for metadata_field in fields(BackupMetadata)))
+
+INSERT_METADATA_SQL = """
+    INSERT OR REPLACE INTO backup_metadata 
+    (backup_id, timestamp, date, backup_type, source_path, destination_path,
+     file_count, total_size_bytes, compression_ratio, checksum, status,
+     error_message, created_at, expires_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Rows committed per transaction by _store_backup_metadata_batch
+METADATA_BATCH_SIZE = 10000
+
+
 @dataclass
 class BackupConfig:
     """Configuration for backup operations."""
@@ -55,10 +438,22 @@ class BackupConfig:
     retention_days: int = 30
     max_backups: int = 10
     exclude_patterns: List[str] = None
+    checksum_algorithm: Optional[str] = None  # 'blake3', 'blake2b' or 'sha256'
+    checksum_workers: Optional[int] = None  # Threads hashing files of a directory backup
+    compression_format: str = 'zstd'  # 'zstd' (needs zstandard) or 'gzip' (pigz, isal or zlib)
+    compression_level: int = 3  # zstd level
+    stats_cache_ttl: float = 30  # Seconds get_backup_stats results are reused; 0 disables
     
     def __post_init__(self):
         if self.exclude_patterns is None:
             self.exclude_patterns = ['*.tmp', '*.log', '__pycache__']
+        if self.compression_format not in ARCHIVE_NAMES:
+            raise ValueError(f"Unsupported compression format: {self.compression_format}")
+        if self.compression_format == 'zstd' and not ZSTD_AVAILABLE:
+            self.compression_format = 'gzip'
+        self.checksum_algorithm = resolve_checksum_algorithm(self.checksum_algorithm)
+        if self.checksum_workers is None:
+            self.checksum_workers = os.cpu_count() or 1
 
 
 class BackupManager:
@@ -79,9 +474,14 @@ class BackupManager:
         
         # Initialize backup configuration
         self.backup_config = self._load_backup_config()
+        self._exclude_re = compile_exclude_patterns(self.backup_config.exclude_patterns)
         
         # Initialize backup metadata database
         self.backup_db_path = os.path.join(self.backup_config.backup_root, "backup_metadata.db")
+        self._conn: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.RLock()
+        # (monotonic time computed, stats); cleared whenever metadata changes
+        self._stats_cache: Optional[Tuple[float, Dict[str, Any]]] = None
         self._init_backup_db()
         
         logger.info(f"Backup manager initialized: {self.backup_config.backup_root}")
@@ -99,16 +499,42 @@ class BackupManager:
             encryption_key=backup_config.get('encryption_key'),
             retention_days=backup_config.get('retention_days', 30),
             max_backups=backup_config.get('max_backups', 10),
-            exclude_patterns=backup_config.get('exclude_patterns', [])
+            exclude_patterns=backup_config.get('exclude_patterns', []),
+            checksum_algorithm=backup_config.get('checksum_algorithm'),
+            checksum_workers=backup_config.get('checksum_workers'),
+            compression_format=backup_config.get('compression_format', 'zstd'),
+            compression_level=backup_config.get('compression_level', 3),
+            stats_cache_ttl=backup_config.get('stats_cache_ttl', 30)
         )
     
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Get the manager's backup metadata connection, opening it on first use.
+        
+        One connection is kept for the manager's lifetime instead of reconnecting
+        per operation; callers serialize access with _db_lock.
+        """
+        if self._conn is None:
+            conn = sqlite3.connect(self.backup_db_path, check_same_thread=False)
+            for pragma in SQLITE_PRAGMAS:
+                conn.execute(pragma)
+            self._conn = conn
+        return self._conn
+    
+    def close(self):
+        """Close the backup metadata connection."""
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+    
     def _init_backup_db(self):
         """Initialize backup metadata database."""
         # Create backup root directory
         Path(self.backup_config.backup_root).mkdir(parents=True, exist_ok=True)
         
         # Create backup metadata database
-        with sqlite3.connect(self.backup_db_path) as conn:
+        with self._db_lock, self._connect() as conn:
             cursor = conn.cursor()
             
             # Create backup_metadata table
@@ -137,6 +563,19 @@ class BackupManager:
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_backup_type ON backup_metadata(backup_type)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_backup_status ON backup_metadata(status)")
             
+            # Indexes matching the cleanup and stats filters on status + timestamp
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_backup_cleanup'")
+            needs_analyze = cursor.fetchone() is None
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_backup_cleanup ON backup_metadata(timestamp)
+                WHERE status = 'success'
+            """)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_backup_status_ts ON backup_metadata(status, timestamp)")
+            
+            # Refresh planner statistics once, when the indexes are first added
+            if needs_analyze:
+                cursor.execute("ANALYZE")
+            
             conn.commit()
     
     def _generate_backup_id(self) -> str:
@@ -144,41 +583,131 @@ class BackupManager:
         timestamp = int(time.time())
         return f"backup_{timestamp}"
     
-    def _calculate_checksum(self, file_path: str) -> str:
-        """Calculate SHA256 checksum of a file."""
-        sha256_hash = hashlib.sha256()
+    def _calculate_checksum(self, file_path: str, algorithm: str = None) -> str:
+        """
+        Calculate the integrity checksum of a file.
+        
+        The digest is prefixed with its algorithm tag (see CHECKSUM_PREFIXES)
+        so verification can dispatch on it; SHA256 digests are unprefixed, as
+        stored by older backups. A directory is hashed as a tree: the digest
+        covers each file's relative path and checksum in sorted order.
+        
+        Args:
+            file_path: File or directory to hash
+            algorithm: 'blake3', 'blake2b' or 'sha256' (default: configured algorithm)
+            
+        Returns:
+            Tagged hex digest, or "" on failure
+        """
+        algorithm = resolve_checksum_algorithm(algorithm or self.backup_config.checksum_algorithm)
+        if os.path.isdir(file_path):
+            return self._calculate_tree_checksum(file_path, algorithm)
+        
         try:
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(chunk)
-            return sha256_hash.hexdigest()
+            return CHECKSUM_PREFIXES[algorithm] + _file_hexdigest(file_path, algorithm)
         except Exception as e:
             logger.error(f"Failed to calculate checksum for {file_path}: {e}")
             return ""
     
+    def verify_checksum(self, file_path: str, expected: str) -> bool:
+        """
+        Check a file or directory against a stored checksum.
+        
+        The algorithm is taken from the checksum's tag, so untagged SHA256
+        checksums stored by older backups still verify.
+        
+        Args:
+            file_path: File or directory to hash
+            expected: Stored checksum, tagged or legacy SHA256
+            
+        Returns:
+            True if the checksum matches
+        """
+        actual = self._calculate_checksum(file_path, checksum_algorithm_of(expected))
+        return bool(actual) and hmac.compare_digest(actual, expected)
+    
+    def _calculate_tree_checksum(self, directory: str, algorithm: str) -> str:
+        """
+        Calculate a checksum over every file in a directory tree.
+        
+        Files are hashed on a thread pool (hashlib and blake3 release the GIL
+        while hashing), or for very large trees on a process pool with shards
+        balanced by size, then combined in sorted path order.
+        """
+        tree_hash = _new_hash(algorithm)
+        workers = self.backup_config.checksum_workers
+        try:
+            tree = self._scan_tree(directory)
+            paths = sorted(tree.paths)
+            if len(paths) > PROCESS_HASH_THRESHOLD and workers > 1:
+                checksums_by_path: Dict[str, str] = {}
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    shards = _partition_by_size(tree.paths, tree.sizes, workers)
+                    for shard_results in executor.map(_hash_file_shard, shards, [algorithm] * len(shards)):
+                        checksums_by_path.update(shard_results)
+                file_checksums = [checksums_by_path[path] for path in paths]
+            else:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    file_checksums = list(executor.map(
+                        lambda path: self._calculate_checksum(path, algorithm), paths
+                    ))
+            
+            for file_path, file_checksum in zip(paths, file_checksums):
+                if not file_checksum:
+                    return ""
+                relative_path = os.path.relpath(file_path, directory).replace(os.sep, "/")
+                tree_hash.update(f"{relative_path}\0{file_checksum}\n".encode())
+            return CHECKSUM_PREFIXES[algorithm] + tree_hash.hexdigest()
+        except Exception as e:
+            logger.error(f"Failed to calculate checksum for {directory}: {e}")
+            return ""
+    
+    def _scan_tree(self, directory: str) -> 'TreeEntries':
+        """
+        Walk a directory tree once, recording each file's path, size and mtime.
+        
+        DirEntry answers type checks from the directory listing, leaving one
+        stat per file. Symlinked files are recorded with their target's stat;
+        symlinked directories are not descended into.
+        
+        Args:
+            directory: Root directory to scan
+            
+        Returns:
+            TreeEntries for every file under directory
+        """
+        tree = TreeEntries()
+        pending = [directory]
+        while pending:
+            try:
+                entries = os.scandir(pending.pop())
+            except OSError:
+                # Unreadable directories are skipped, as os.walk does
+                continue
+            
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file():
+                        st = entry.stat()
+                        tree.paths.append(entry.path)
+                        tree.sizes.append(st.st_size)
+                        tree.mtimes.append(st.st_mtime_ns)
+        return tree
+    
     def _get_file_count_and_size(self, directory: str) -> tuple[int, int]:
         """Get file count and total size of a directory."""
-        file_count = 0
-        total_size = 0
-        
         try:
-            for root, dirs, files in os.walk(directory):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    if os.path.exists(file_path):
-                        file_count += 1
-                        total_size += os.path.getsize(file_path)
+            tree = self._scan_tree(directory)
+            return len(tree), tree.total_size
         except Exception as e:
             logger.error(f"Failed to calculate directory size: {e}")
-        
-        return file_count, total_size
+            return 0, 0
     
     def _should_exclude_file(self, file_path: str) -> bool:
-        """Check if file should be excluded from backup."""
-        for pattern in self.backup_config.exclude_patterns:
-            if file_path.endswith(pattern.replace('*', '')):
-                return True
-        return False
+        """Check if file should be excluded from backup, by glob match on its name."""
+        return self._exclude_re is not None and self._exclude_re.match(os.path.basename(file_path)) is not None
     
     def backup_storage(self, dest_path: str, backup_type: str = "full") -> BackupMetadata:
         """
@@ -209,18 +738,21 @@ class BackupManager:
             # Calculate source size and file count
             file_count, total_size = self._get_file_count_and_size(source_path)
             
-            # Perform backup based on type
+            # Perform backup based on type; compressed backups are hashed as written
+            checksum = None
             if backup_type == "metadata_only":
                 # Only backup metadata (database)
-                self._backup_database(dest_path)
+                checksum_path = self._backup_database(dest_path)
                 actual_file_count = 1  # Only database file
                 actual_size = os.path.getsize(os.path.join(dest_path, "images.db"))
             else:
                 # Backup storage directory
-                if self.backup_config.compression:
-                    self._backup_with_compression(source_path, dest_path)
+                if backup_type == "incremental":
+                    checksum_path = self._incremental_sync(source_path, dest_path)
+                elif self.backup_config.compression:
+                    checksum_path, checksum = self._backup_with_compression(source_path, dest_path)
                 else:
-                    self._backup_with_shutil(source_path, dest_path)
+                    checksum_path = self._backup_with_shutil(source_path, dest_path)
                 
                 # Calculate actual backup size
                 actual_file_count, actual_size = self._get_file_count_and_size(dest_path)
@@ -228,8 +760,10 @@ class BackupManager:
             # Calculate compression ratio
             compression_ratio = actual_size / total_size if total_size > 0 else 1.0
             
-            # Calculate checksum
-            checksum = self._calculate_checksum(dest_path)
+            # Calculate checksum of what this backup wrote (archive, database
+            # file or copied storage tree), not the whole destination directory
+            if checksum is None:
+                checksum = self._calculate_checksum(checksum_path)
             
             # Create backup metadata
             backup_metadata = BackupMetadata(
@@ -274,28 +808,206 @@ class BackupManager:
             self._store_backup_metadata(backup_metadata)
             return backup_metadata
     
-    def _backup_with_compression(self, source_path: str, dest_path: str):
-        """Backup with compression using tar.gz."""
-        backup_file = os.path.join(dest_path, "storage_backup.tar.gz")
+    def _backup_with_compression(self, source_path: str, dest_path: str) -> Tuple[str, str]:
+        """
+        Backup with compression using tar.zst (multithreaded zstd) or tar.gz.
+        
+        The archive is hashed while it is written, so it doesn't have to be
+        read back from disk for its checksum.
+        
+        Returns:
+            Tuple of (archive path, archive checksum)
+        """
+        compression_format = self.backup_config.compression_format
+        backup_file = os.path.join(dest_path, ARCHIVE_NAMES[compression_format])
+        algorithm = self.backup_config.checksum_algorithm
         
-        with tarfile.open(backup_file, "w:gz") as tar:
-            tar.add(source_path, arcname="storage", filter=self._tar_filter)
+        with open(backup_file, "wb") as out:
+            writer = HashingWriter(out, algorithm)
+            if compression_format == 'zstd':
+                compressor = zstandard.ZstdCompressor(level=self.backup_config.compression_level, threads=-1)
+                with compressor.stream_writer(writer, closefd=False) as zstd_writer, \
+                        tarfile.open(mode="w|", fileobj=zstd_writer) as tar:
+                    tar.add(source_path, arcname="storage", filter=self._tar_filter)
+            else:
+                pigz = shutil.which("pigz")
+                if pigz:
+                    self._backup_with_pigz(source_path, writer, pigz)
+                elif ISAL_AVAILABLE:
+                    # ISA-L deflate with PCLMULQDQ CRC32; level 3 is its highest
+                    with igzip.IGzipFile(fileobj=writer, mode="wb", compresslevel=3) as gz, \
+                            tarfile.open(mode="w|", fileobj=gz) as tar:
+                        tar.add(source_path, arcname="storage", filter=self._tar_filter)
+                else:
+                    with tarfile.open(mode="w:gz", fileobj=writer) as tar:
+                        tar.add(source_path, arcname="storage", filter=self._tar_filter)
         
         logger.info(f"Compressed backup created: {backup_file}")
+        return backup_file, CHECKSUM_PREFIXES[algorithm] + writer.hexdigest()
+    
+    def _backup_with_pigz(self, source_path: str, writer: 'HashingWriter', pigz: str):
+        """
+        Write the tar stream through a parallel pigz process.
+        
+        Headers are built in Python; file contents are spliced into the pipe
+        with sendfile instead of being copied through Python buffers. pigz's
+        output is pumped into the writer on a separate thread.
+        """
+        process = subprocess.Popen(
+            [pigz, "-c", "-p", str(os.cpu_count() or 1)],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE
+        )
+        pump_errors: List[BaseException] = []
+        
+        def pump():
+            try:
+                shutil.copyfileobj(process.stdout, writer, CHECKSUM_CHUNK_SIZE)
+            except BaseException as e:
+                pump_errors.append(e)
+        
+        pump_thread = threading.Thread(target=pump, name="pigz-output", daemon=True)
+        pump_thread.start()
+        try:
+            self._write_tar_stream(source_path, "storage", process.stdin.fileno())
+        except BrokenPipeError:
+            # pigz exited early; reported through its exit status below
+            pass
+        finally:
+            process.stdin.close()
+            pump_thread.join()
+            process.stdout.close()
+            returncode = process.wait()
+        
+        if pump_errors:
+            raise pump_errors[0]
+        if returncode != 0:
+            raise RuntimeError(f"pigz exited with status {returncode}")
+    
+    def _write_tar_stream(self, source_path: str, arcname: str, out_fd: int):
+        """Write a tar archive of source_path to a file descriptor."""
+        written = 0
+        
+        # Same traversal as TarFile.add: parents first, directory entries sorted
+        pending = [(source_path, arcname)]
+        while pending:
+            path, name = pending.pop()
+            tarinfo = self._tar_filter(self._make_tarinfo(path, name))
+            if tarinfo is None:
+                continue
+            
+            header = tarinfo.tobuf(tarfile.DEFAULT_FORMAT, tarfile.ENCODING, "surrogateescape")
+            _write_all(out_fd, header)
+            written += len(header)
+            
+            if tarinfo.isreg():
+                in_fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+                try:
+                    _copy_fd(in_fd, out_fd, tarinfo.size)
+                finally:
+                    os.close(in_fd)
+                
+                padding = -tarinfo.size % tarfile.BLOCKSIZE
+                _write_all(out_fd, bytes(padding))
+                written += tarinfo.size + padding
+            elif tarinfo.isdir():
+                pending.extend(
+                    (os.path.join(path, child), f"{name}/{child}")
+                    for child in sorted(os.listdir(path), reverse=True)
+                )
+        
+        # End-of-archive marker, padded to a full record like tarfile does
+        trailer = 2 * tarfile.BLOCKSIZE
+        trailer += -(written + trailer) % tarfile.RECORDSIZE
+        _write_all(out_fd, bytes(trailer))
+    
+    def _make_tarinfo(self, path: str, arcname: str) -> Optional[tarfile.TarInfo]:
+        """Build a TarInfo for a path, or None for unsupported file types."""
+        st = os.lstat(path)
+        tarinfo = tarfile.TarInfo(arcname)
+        tarinfo.mode = stat.S_IMODE(st.st_mode)
+        tarinfo.uid = st.st_uid
+        tarinfo.gid = st.st_gid
+        tarinfo.mtime = int(st.st_mtime)
+        
+        if stat.S_ISREG(st.st_mode):
+            tarinfo.type = tarfile.REGTYPE
+            tarinfo.size = st.st_size
+        elif stat.S_ISDIR(st.st_mode):
+            tarinfo.type = tarfile.DIRTYPE
+        elif stat.S_ISLNK(st.st_mode):
+            tarinfo.type = tarfile.SYMTYPE
+            tarinfo.linkname = os.readlink(path)
+        else:
+            return None
+        return tarinfo
     
-    def _backup_with_shutil(self, source_path: str, dest_path: str):
-        """Backup using shutil.copytree."""
+    def _backup_with_shutil(self, source_path: str, dest_path: str) -> str:
+        """Backup using shutil.copytree. Returns the copied storage directory."""
         dest_storage = os.path.join(dest_path, "storage")
         
         if os.path.exists(dest_storage):
             shutil.rmtree(dest_storage)
         
-        shutil.copytree(source_path, dest_storage, ignore=self._shutil_ignore)
+        shutil.copytree(source_path, dest_storage, ignore=self._shutil_ignore,
+                        copy_function=_cow_copy)
         logger.info(f"Directory backup created: {dest_storage}")
+        return dest_storage
+    
+    def _incremental_sync(self, source_path: str, dest_path: str) -> str:
+        """
+        Bring a directory backup up to date, copying only what changed.
+        
+        Files are compared by relative path, size and mtime (copies keep the
+        source mtime, so unchanged files match on the next run). Files and
+        directories no longer in the source are removed from the backup.
+        
+        Args:
+            source_path: Storage directory to back up
+            dest_path: Backup destination; the copy lives in its storage/ subdirectory
+            
+        Returns:
+            The synced storage directory
+        """
+        dest_storage = os.path.join(dest_path, "storage")
+        
+        def index(tree: TreeEntries, root: str) -> Dict[str, tuple]:
+            return {
+                os.path.relpath(path, root): (size, mtime)
+                for path, size, mtime in zip(tree.paths, tree.sizes, tree.mtimes)
+            }
+        
+        source_files = {
+            relative_path: key
+            for relative_path, key in index(self._scan_tree(source_path), source_path).items()
+            if not any(self._should_exclude_file(part) for part in relative_path.split(os.sep))
+        }
+        dest_files = index(self._scan_tree(dest_storage), dest_storage)
+        
+        copied = 0
+        for relative_path, key in source_files.items():
+            if dest_files.get(relative_path) == key:
+                continue
+            target = os.path.join(dest_storage, relative_path)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            _cow_copy(os.path.join(source_path, relative_path), target)
+            copied += 1
+        
+        removed = 0
+        for relative_path in dest_files.keys() - source_files.keys():
+            os.unlink(os.path.join(dest_storage, relative_path))
+            removed += 1
+        
+        # Drop directories left empty by removals, deepest first
+        for root, dirs, files in os.walk(dest_storage, topdown=False):
+            if root != dest_storage and not os.listdir(root):
+                os.rmdir(root)
+        
+        logger.info(f"Incremental backup synced: {dest_storage} ({copied} copied, {removed} removed)")
+        return dest_storage
     
     def _tar_filter(self, tarinfo):
         """Filter function for tar backup."""
-        if self._should_exclude_file(tarinfo.name):
+        if tarinfo is None or self._should_exclude_file(tarinfo.name):
             return None
         return tarinfo
     
@@ -308,8 +1020,8 @@ class BackupManager:
                 ignored.append(file)
         return ignored
     
-    def _backup_database(self, dest_path: str):
-        """Backup database file."""
+    def _backup_database(self, dest_path: str) -> str:
+        """Backup database file. Returns the destination database path."""
         db_source = self.backup_config.db_path
         db_dest = os.path.join(dest_path, "images.db")
         
@@ -318,6 +1030,7 @@ class BackupManager:
             logger.info(f"Database backed up: {db_dest}")
         else:
             logger.warning(f"Database file not found: {db_source}")
+        return db_dest
     
     def restore_backup(self, src_path: str, restore_path: str = None) -> bool:
         """
@@ -344,7 +1057,9 @@ class BackupManager:
             Path(restore_path).mkdir(parents=True, exist_ok=True)
             
             # Check if it's a compressed backup
-            if src_path.endswith('.tar.gz'):
+            if src_path.endswith('.tar.zst'):
+                self._restore_from_zstd(src_path, restore_path)
+            elif src_path.endswith('.tar.gz'):
                 self._restore_from_compressed(src_path, restore_path)
             else:
                 self._restore_from_directory(src_path, restore_path)
@@ -358,8 +1073,25 @@ class BackupManager:
     
     def _restore_from_compressed(self, src_path: str, restore_path: str):
         """Restore from compressed backup."""
-        with tarfile.open(src_path, "r:gz") as tar:
-            tar.extractall(restore_path)
+        with open(src_path, "rb", buffering=RESTORE_BUFFER_SIZE) as f:
+            if ISAL_AVAILABLE:
+                with igzip.IGzipFile(fileobj=f, mode="rb") as gz, \
+                        tarfile.open(mode="r|", fileobj=gz, bufsize=RESTORE_BUFFER_SIZE) as tar:
+                    tar.extractall(restore_path, **TAR_EXTRACT_OPTIONS)
+            else:
+                with tarfile.open(mode="r|gz", fileobj=f, bufsize=RESTORE_BUFFER_SIZE) as tar:
+                    tar.extractall(restore_path, **TAR_EXTRACT_OPTIONS)
+        logger.info(f"Restored from compressed backup: {src_path}")
+    
+    def _restore_from_zstd(self, src_path: str, restore_path: str):
+        """Restore from zstd-compressed backup."""
+        if not ZSTD_AVAILABLE:
+            raise RuntimeError("zstandard is required to restore .tar.zst backups")
+        
+        with open(src_path, "rb") as f, \
+                zstandard.ZstdDecompressor().stream_reader(f, read_size=RESTORE_BUFFER_SIZE) as reader, \
+                tarfile.open(mode="r|", fileobj=reader, bufsize=RESTORE_BUFFER_SIZE) as tar:
+            tar.extractall(restore_path, **TAR_EXTRACT_OPTIONS)
         logger.info(f"Restored from compressed backup: {src_path}")
     
     def _restore_from_directory(self, src_path: str, restore_path: str):
@@ -382,79 +1114,72 @@ class BackupManager:
     
     def _store_backup_metadata(self, backup_metadata: BackupMetadata):
         """Store backup metadata in database."""
+        self._store_backup_metadata_batch([backup_metadata])
+    
+    def _store_backup_metadata_batch(self, backups: List[BackupMetadata]):
+        """
+        Store metadata for several backups in as few transactions as possible.
+        
+        Rows are written with executemany through one unchanging statement, so
+        the connection's statement cache keeps it prepared between calls.
+        Each METADATA_BATCH_SIZE rows are committed as one transaction.
+        
+        Args:
+            backups: Backup metadata to insert or replace
+        """
         try:
-            with sqlite3.connect(self.backup_db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT OR REPLACE INTO backup_metadata 
-                    (backup_id, timestamp, date, backup_type, source_path, destination_path,
-                     file_count, total_size_bytes, compression_ratio, checksum, status,
-                     error_message, created_at, expires_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    backup_metadata.backup_id,
-                    backup_metadata.timestamp,
-                    backup_metadata.date,
-                    backup_metadata.backup_type,
-                    backup_metadata.source_path,
-                    backup_metadata.destination_path,
-                    backup_metadata.file_count,
-                    backup_metadata.total_size_bytes,
-                    backup_metadata.compression_ratio,
-                    backup_metadata.checksum,
-                    backup_metadata.status,
-                    backup_metadata.error_message,
-                    backup_metadata.created_at,
-                    backup_metadata.expires_at
-                ))
-                conn.commit()
+            with self._db_lock:
+                self._stats_cache = None
+                conn = self._connect()
+                for start in range(0, len(backups), METADATA_BATCH_SIZE):
+                    rows = [_metadata_row(backup) for backup in backups[start:start + METADATA_BATCH_SIZE]]
+                    try:
+                        conn.execute("BEGIN IMMEDIATE")
+                        conn.executemany(INSERT_METADATA_SQL, rows)
+                        conn.commit()
+                    except Exception:
+                        conn.rollback()
+                        raise
         except Exception as e:
             logger.error(f"Failed to store backup metadata: {e}")
     
     def get_backup_list(self, limit: int = 10) -> List[BackupMetadata]:
         """Get list of recent backups."""
         try:
-            with sqlite3.connect(self.backup_db_path) as conn:
+            with self._db_lock, self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     SELECT * FROM backup_metadata 
                     ORDER BY timestamp DESC 
                     LIMIT ?
                 """, (limit,))
-                rows = cursor.fetchall()
-                
-                backups = []
-                for row in rows:
-                    backup = BackupMetadata(
-                        backup_id=row[0],
-                        timestamp=row[1],
-                        date=row[2],
-                        backup_type=row[3],
-                        source_path=row[4],
-                        destination_path=row[5],
-                        file_count=row[6],
-                        total_size_bytes=row[7],
-                        compression_ratio=row[8],
-                        checksum=row[9],
-                        status=row[10],
-                        error_message=row[11],
-                        created_at=row[12],
-                        expires_at=row[13]
-                    )
-                    backups.append(backup)
-                
-                return backups
+                # Columns are in BackupMetadata field order; build rows positionally
+                # while iterating the cursor instead of materializing fetchall()
+                return [BackupMetadata(*row) for row in cursor]
         except Exception as e:
             logger.error(f"Failed to get backup list: {e}")
             return []
     
+    def get_backup_by_id(self, backup_id: str) -> Optional[BackupMetadata]:
+        """Get a single backup by ID via a primary key lookup."""
+        try:
+            with self._db_lock, self._connect() as conn:
+                row = conn.execute(
+                    "SELECT * FROM backup_metadata WHERE backup_id = ?", (backup_id,)
+                ).fetchone()
+                return BackupMetadata(*row) if row else None
+        except Exception as e:
+            logger.error(f"Failed to get backup {backup_id}: {e}")
+            return None
+    
     def cleanup_old_backups(self):
         """Clean up old backups based on retention policy."""
         try:
             cutoff_date = datetime.now() - timedelta(days=self.backup_config.retention_days)
             cutoff_timestamp = cutoff_date.timestamp()
             
-            with sqlite3.connect(self.backup_db_path) as conn:
+            with self._db_lock, self._connect() as conn:
+                self._stats_cache = None
                 cursor = conn.cursor()
                 
                 # Get old backups
@@ -487,31 +1212,35 @@ class BackupManager:
             logger.error(f"Failed to cleanup old backups: {e}")
     
     def get_backup_stats(self) -> Dict[str, Any]:
-        """Get backup statistics."""
+        """
+        Get backup statistics.
+        
+        Results are reused for stats_cache_ttl seconds unless backups are
+        stored or cleaned up in the meantime, so frequent polling doesn't
+        rescan the metadata table. The recent-backup count can lag by up to
+        the TTL.
+        """
+        ttl = self.backup_config.stats_cache_ttl
         try:
-            with sqlite3.connect(self.backup_db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Get total backups
-                cursor.execute("SELECT COUNT(*) FROM backup_metadata")
-                total_backups = cursor.fetchone()[0]
-                
-                # Get successful backups
-                cursor.execute("SELECT COUNT(*) FROM backup_metadata WHERE status = 'success'")
-                successful_backups = cursor.fetchone()[0]
+            with self._db_lock, self._connect() as conn:
+                if ttl > 0 and self._stats_cache is not None:
+                    computed_at, stats = self._stats_cache
+                    if time.monotonic() - computed_at <= ttl:
+                        return dict(stats)
                 
-                # Get total size
-                cursor.execute("SELECT SUM(total_size_bytes) FROM backup_metadata WHERE status = 'success'")
-                total_size = cursor.fetchone()[0] or 0
+                cursor = conn.cursor()
                 
-                # Get recent backups
+                # Totals, successes, successful size and recent backups in one scan
                 cursor.execute("""
-                    SELECT COUNT(*) FROM backup_metadata 
-                    WHERE timestamp > ?
-                """, (time.time() - 86400,))  # Last 24 hours
-                recent_backups = cursor.fetchone()[0]
+                    SELECT COUNT(*),
+                           COALESCE(SUM(status = 'success'), 0),
+                           COALESCE(SUM(CASE WHEN status = 'success' THEN total_size_bytes END), 0),
+                           COALESCE(SUM(timestamp > ?), 0)
+                    FROM backup_metadata
+                """, (time.time() - 86400,))  # Recent = last 24 hours
+                total_backups, successful_backups, total_size, recent_backups = cursor.fetchone()
                 
-                return {
+                stats = {
                     "total_backups": total_backups,
                     "successful_backups": successful_backups,
                     "failed_backups": total_backups - successful_backups,
@@ -520,6 +1249,9 @@ class BackupManager:
                     "retention_days": self.backup_config.retention_days,
                     "max_backups": self.backup_config.max_backups
                 }
+                if ttl > 0:
+                    self._stats_cache = (time.monotonic(), stats)
+                return dict(stats)
                 
         except Exception as e:
             logger.error(f"Failed to get backup stats: {e}")
@@ -553,6 +1285,11 @@ def get_backup_list(limit: int = 10) -> List[BackupMetadata]:
     return get_backup_manager().get_backup_list(limit)
 
 
+def get_backup_by_id(backup_id: str) -> Optional[BackupMetadata]:
+    """Get a single backup by ID."""
+    return get_backup_manager().get_backup_by_id(backup_id)
+
+
 def cleanup_old_backups():
     """Clean up old backups."""
     get_backup_manager().cleanup_old_backups()
@@ -5,15 +5,17 @@ Provides commands for managing backups, restoring data, and monitoring backup st
 """
 
 import argparse
+import functools
 import sys
 import os
 import json
 from datetime import datetime
 from pathlib import Path
+from typing import List, Optional
 
 from .backup import (
     get_backup_manager, backup_storage, restore_backup,
-    get_backup_list, cleanup_old_backups, get_backup_stats
+    get_backup_list, get_backup_by_id, cleanup_old_backups, get_backup_stats
 )
 from .utils.logger import get_logger
 
@@ -82,24 +84,8 @@ def cmd_list(args):
         
         if args.json:
             # Output as JSON
-            backup_data = []
-            for backup in backups:
-                backup_data.append({
-                    'backup_id': backup.backup_id,
-                    'timestamp': backup.timestamp,
-                    'date': backup.date,
-                    'backup_type': backup.backup_type,
-                    'source_path': backup.source_path,
-                    'destination_path': backup.destination_path,
-                    'file_count': backup.file_count,
-                    'total_size_bytes': backup.total_size_bytes,
-                    'compression_ratio': backup.compression_ratio,
-                    'checksum': backup.checksum,
-                    'status': backup.status,
-                    'error_message': backup.error_message,
-                    'created_at': backup.created_at,
-                    'expires_at': backup.expires_at
-                })
+            # BackupMetadata instance dicts hold exactly the serialized fields, in order
+            backup_data = [backup.__dict__ for backup in backups]
             print(json.dumps(backup_data, indent=2, default=str))
         else:
             # Output as table
@@ -187,13 +173,7 @@ def cmd_info(args):
     """Show backup information."""
     try:
         backup_id = args.backup_id
-        backups = get_backup_list(limit=100)  # Get more backups to find the one
-        
-        backup = None
-        for b in backups:
-            if b.backup_id == backup_id:
-                backup = b
-                break
+        backup = get_backup_by_id(backup_id)
         
         if not backup:
             print(f"✗ Backup not found: {backup_id}")
@@ -241,8 +221,9 @@ def cmd_schedule(args):
         sys.exit(1)
 
 
-def main():
-    """Main CLI entry point."""
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser (once per process)."""
     parser = argparse.ArgumentParser(
         description="PixVault Backup CLI",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -317,7 +298,18 @@ Examples:
     schedule_parser = subparsers.add_parser('schedule', help='Schedule backup operations')
     schedule_parser.set_defaults(func=cmd_schedule)
     
-    args = parser.parse_args()
+    return parser
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Main CLI entry point.
+    
+    Args:
+        argv: Arguments to parse (default: sys.argv[1:])
+    """
+    parser = _build_parser()
+    args = parser.parse_args(argv)
     
     if not args.command:
         parser.print_help()
@@ -15,6 +15,7 @@ from .config import load_config, validate_config
 from .db import init_db
 from .adapters.unsplash import search_unsplash
 from .adapters.browser import fetch_images_sync
+from .adapters.base import ImageItem
 from .adapters.manager import get_all_adapters, get_adapter
 from .downloader import download_and_store
 from .utils.logger import get_logger
@@ -200,7 +201,7 @@ Examples:
                         for image_data in url_list:
                             try:
                                 # Handle both old format (url only) and new format (with metadata)
-                                if isinstance(image_data, dict) and 'url' in image_data:
+                                if isinstance(image_data, (dict, ImageItem)) and 'url' in image_data:
                                     url = image_data['url']
                                     source_name = image_data.get('source', source)
                                 else:
@@ -248,8 +249,8 @@ Examples:
                             except Exception as e:
                                 source_results[source]['failed'] += 1
                                 total_results['failed'] += 1
-                                url = image_data.get('url', str(image_data)) if isinstance(image_data, dict) else str(image_data)
-                                source_name = image_data.get('source', source) if isinstance(image_data, dict) else source
+                                url = image_data.get('url', str(image_data)) if isinstance(image_data, (dict, ImageItem)) else str(image_data)
+                                source_name = image_data.get('source', source) if isinstance(image_data, (dict, ImageItem)) else source
                                 error_info = {
                                     'url': url,
                                     'source': source_name,
@@ -3,13 +3,24 @@ Centralized HTTP client for PixVault.
 Provides User-Agent rotation and proxy support for all adapters.
 """
 
+import asyncio
+import json
 import random
+import threading
 import time
-from typing import Dict, List, Optional, Any
+import weakref
+from contextlib import contextmanager
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Any
 import httpx
 from urllib.parse import urlparse
 from .logger import get_logger
 
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 logger = get_logger("harvest.utils.http_client")
 
 
@@ -34,10 +45,27 @@ class HTTPClient:
         self.max_retries = self.config.get('max_retries', 3)
         self.retry_delay = self.config.get('retry_delay', 1.0)
         
+        # Connection pool settings, shared by all requests made through this client
+        self.http2 = self.config.get('http2', True) and HTTP2_AVAILABLE
+        self.limits = httpx.Limits(
+            max_keepalive_connections=self.config.get('max_keepalive_connections', 64),
+            max_connections=self.config.get('max_connections', 128),
+            keepalive_expiry=self.config.get('keepalive_expiry', 60)
+        )
+        
         # Initialize proxy rotation
         self._proxy_index = 0
         self._last_proxy_use = {}
         
+        # Pooled httpx clients keyed by proxy URL (None for direct connections)
+        self._clients: Dict[Optional[str], httpx.Client] = {}
+        self._clients_lock = threading.Lock()
+        
+        # Pooled async clients keyed by the event loop they belong to, then by proxy URL,
+        # plus the generator per loop that closes them when the loop shuts down
+        self._async_clients: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Optional[str], httpx.AsyncClient]]' = weakref.WeakKeyDictionary()
+        self._async_closers: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncIterator[None]]' = weakref.WeakKeyDictionary()
+        
         logger.info(f"HTTP Client initialized with {len(self.user_agents)} User-Agents and {len(self.proxies)} proxies")
     
     def get_random_user_agent(self) -> str:
@@ -127,6 +155,127 @@ class HTTPClient:
         
         return headers
     
+    def _get_pooled_client(self, proxy_url: Optional[str] = None) -> httpx.Client:
+        """
+        Get the long-lived httpx client for a proxy, creating it on first use.
+        
+        Reusing one client per proxy keeps connections alive between requests,
+        so repeated calls skip the TCP and TLS handshakes.
+        
+        Args:
+            proxy_url: Proxy URL or None for direct connections
+            
+        Returns:
+            httpx Client instance
+        """
+        client = self._clients.get(proxy_url)
+        if client is not None:
+            return client
+        
+        with self._clients_lock:
+            client = self._clients.get(proxy_url)
+            if client is None:
+                client = httpx.Client(
+                    http2=self.http2,
+                    limits=self.limits,
+                    timeout=self.timeout,
+                    proxy=proxy_url
+                )
+                self._clients[proxy_url] = client
+        
+        return client
+    
+    async def _get_async_client(self, proxy_url: Optional[str] = None) -> httpx.AsyncClient:
+        """
+        Get the long-lived async httpx client for a proxy, creating it on first use.
+        
+        Async connections are bound to the event loop that opened them, so each
+        loop gets its own clients. They are closed when the loop shuts down its
+        async generators (asyncio.run does this on exit), or by aclose().
+        
+        Args:
+            proxy_url: Proxy URL or None for direct connections
+            
+        Returns:
+            httpx AsyncClient instance
+        """
+        loop = asyncio.get_running_loop()
+        clients = self._async_clients.get(loop)
+        if clients is None:
+            clients = self._async_clients[loop] = {}
+            # Park a generator at its first yield; the loop's shutdown_asyncgens()
+            # closes it, and its finally block closes this loop's clients
+            closer = self._async_closers[loop] = self._close_on_loop_shutdown(weakref.ref(loop), clients)
+            await closer.asend(None)
+        
+        client = clients.get(proxy_url)
+        if client is None:
+            client = clients[proxy_url] = httpx.AsyncClient(
+                http2=self.http2,
+                limits=self.limits,
+                timeout=self.timeout,
+                proxy=proxy_url
+            )
+        return client
+    
+    async def _close_on_loop_shutdown(self, loop_ref: 'weakref.ref[asyncio.AbstractEventLoop]',
+                                      clients: Dict[Optional[str], httpx.AsyncClient]) -> AsyncIterator[None]:
+        """
+        Async generator that closes a loop's clients when it is closed.
+        
+        Holds the loop weakly so the parked generator doesn't keep its
+        WeakKeyDictionary entries alive.
+        """
+        try:
+            yield
+        finally:
+            loop = loop_ref()
+            if loop is not None and self._async_clients.get(loop) is clients:
+                del self._async_clients[loop]
+                self._async_closers.pop(loop, None)
+            await self._aclose_clients(clients)
+    
+    @staticmethod
+    async def _aclose_clients(clients: Dict[Optional[str], httpx.AsyncClient]) -> None:
+        """Close and forget a set of async clients."""
+        pending = list(clients.values())
+        clients.clear()
+        for client in pending:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Failed to close async HTTP client: {e}")
+    
+    def close(self):
+        """Close all pooled connections."""
+        with self._clients_lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        
+        for client in clients:
+            client.close()
+        
+        # Async clients must be closed on their own loop
+        for loop, async_clients in list(self._async_clients.items()):
+            del self._async_clients[loop]
+            self._async_closers.pop(loop, None)
+            if not async_clients or loop.is_closed():
+                continue
+            if loop.is_running():
+                asyncio.run_coroutine_threadsafe(self._aclose_clients(async_clients), loop)
+            else:
+                loop.run_until_complete(self._aclose_clients(async_clients))
+    
+    async def aclose(self):
+        """Close the async clients belonging to the running event loop."""
+        loop = asyncio.get_running_loop()
+        clients = self._async_clients.pop(loop, None)
+        closer = self._async_closers.pop(loop, None)
+        if clients is not None:
+            await self._aclose_clients(clients)
+        if closer is not None:
+            await closer.aclose()
+    
     def get(self, url: str, headers: Dict[str, str] = None, **kwargs) -> httpx.Response:
         """
         Make a GET request with User-Agent rotation and proxy support.
@@ -182,19 +331,19 @@ class HTTPClient:
         }
         
         if proxy_url:
-            httpx_kwargs['proxies'] = proxy_url
             logger.debug(f"Using proxy: {proxy_url}")
         
+        client = self._get_pooled_client(proxy_url)
+        
         # Retry logic
         last_exception = None
         for attempt in range(self.max_retries):
             try:
-                with httpx.Client() as client:
-                    response = client.request(method, url, **httpx_kwargs)
-                    response.raise_for_status()
-                    
-                    logger.debug(f"Request successful: {method} {url} (attempt {attempt + 1})")
-                    return response
+                response = client.request(method, url, **httpx_kwargs)
+                response.raise_for_status()
+                
+                logger.debug(f"Request successful: {method} {url} (attempt {attempt + 1})")
+                return response
                     
             except httpx.HTTPError as e:
                 last_exception = e
@@ -221,17 +370,77 @@ class HTTPClient:
         # If we get here, all retries failed
         raise last_exception or Exception(f"Failed to make request after {self.max_retries} attempts")
     
-    def stream(self, method: str, url: str, headers: Dict[str, str] = None, **kwargs) -> httpx.Response:
+    async def aget(self, url: str, headers: Dict[str, str] = None, **kwargs) -> httpx.Response:
+        """
+        Make an async GET request with User-Agent rotation and proxy support.
+        
+        Requests from the same event loop share one multiplexed HTTP/2
+        connection per host when h2 is installed.
+        
+        Args:
+            url: Request URL
+            headers: Additional headers
+            **kwargs: Additional httpx parameters
+            
+        Returns:
+            httpx Response object
+        """
+        # Get request headers with random User-Agent
+        request_headers = self._get_headers_for_request(headers)
+        
+        # Get proxy for this request
+        proxy_url = self._get_proxy_for_request()
+        
+        # Prepare httpx parameters
+        httpx_kwargs = {
+            'timeout': self.timeout,
+            'headers': request_headers,
+            **kwargs
+        }
+        
+        if proxy_url:
+            logger.debug(f"Using proxy: {proxy_url}")
+        
+        client = await self._get_async_client(proxy_url)
+        
+        # Retry logic
+        last_exception = None
+        for attempt in range(self.max_retries):
+            try:
+                response = await client.request('GET', url, **httpx_kwargs)
+                response.raise_for_status()
+                
+                logger.debug(f"Request successful: GET {url} (attempt {attempt + 1})")
+                return response
+                
+            except Exception as e:
+                last_exception = e
+                logger.warning(f"HTTP error on attempt {attempt + 1}: {e}")
+                
+                if attempt < self.max_retries - 1:
+                    delay = self.retry_delay * (2 ** attempt)  # Exponential backoff
+                    logger.info(f"Retrying in {delay} seconds...")
+                    await asyncio.sleep(delay)
+                else:
+                    logger.error(f"All retry attempts failed for GET {url}")
+        
+        raise last_exception or Exception(f"Failed to make request after {self.max_retries} attempts")
+    
+    @contextmanager
+    def stream(self, method: str, url: str, headers: Dict[str, str] = None, **kwargs) -> Iterator[httpx.Response]:
         """
         Make a streaming request with User-Agent rotation and proxy support.
         
+        Must be used as a context manager; the response body can be read
+        until the block exits, after which the connection returns to the pool.
+        
         Args:
             method: HTTP method (GET, POST, etc.)
             url: Request URL
             headers: Additional headers
             **kwargs: Additional httpx parameters
             
-        Returns:
+        Yields:
             httpx Response object for streaming
         """
         # Get request headers with random User-Agent
@@ -248,12 +457,12 @@ class HTTPClient:
         }
         
         if proxy_url:
-            httpx_kwargs['proxies'] = proxy_url
             logger.debug(f"Using proxy for stream: {proxy_url}")
         
-        with httpx.stream(method, url, **httpx_kwargs) as response:
+        client = self._get_pooled_client(proxy_url)
+        with client.stream(method, url, **httpx_kwargs) as response:
             response.raise_for_status()
-            return response
+            yield response
     
     def get_client(self) -> httpx.Client:
         """
@@ -267,11 +476,13 @@ class HTTPClient:
         
         client_kwargs = {
             'timeout': self.timeout,
-            'headers': self._get_headers_for_request()
+            'headers': self._get_headers_for_request(),
+            'http2': self.http2,
+            'limits': self.limits
         }
         
         if proxy_url:
-            client_kwargs['proxies'] = proxy_url
+            client_kwargs['proxy'] = proxy_url
             logger.debug(f"Client using proxy: {proxy_url}")
         
         return httpx.Client(**client_kwargs)
@@ -280,11 +491,30 @@ class HTTPClient:
 # Global HTTP client instance
 _http_client: Optional[HTTPClient] = None
 
+# HTTP client instances keyed by their serialized configuration
+_http_clients: Dict[str, HTTPClient] = {}
+
+
+def _config_key(config: Dict) -> str:
+    """
+    Build a stable cache key for an HTTP client configuration.
+    
+    Args:
+        config: Configuration dictionary
+        
+    Returns:
+        Serialized configuration
+    """
+    return json.dumps(config, sort_keys=True, default=str)
+
 
 def get_http_client(config: Dict = None) -> HTTPClient:
     """
     Get the global HTTP client instance.
     
+    Clients are cached per configuration, so adapters constructed with the
+    same http_client settings share one instance instead of rebuilding it.
+    
     Args:
         config: Configuration dictionary
         
@@ -293,13 +523,28 @@ def get_http_client(config: Dict = None) -> HTTPClient:
     """
     global _http_client
     
-    if _http_client is None or config is not None:
-        _http_client = HTTPClient(config)
+    if config is None:
+        if _http_client is None:
+            _http_client = HTTPClient()
+        return _http_client
+    
+    key = _config_key(config)
+    client = _http_clients.get(key)
+    if client is None:
+        client = _http_clients[key] = HTTPClient(config)
     
+    _http_client = client
     return _http_client
 
 
 def reset_http_client():
-    """Reset the global HTTP client instance."""
+    """Reset the global HTTP client instance and close its connections."""
     global _http_client
+    
+    for client in _http_clients.values():
+        client.close()
+    if _http_client is not None:
+        _http_client.close()
+    
     _http_client = None
+    _http_clients.clear()
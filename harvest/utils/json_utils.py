@@ -0,0 +1,41 @@
+"""
+Fast JSON helpers for PixVault.
+Uses orjson when it is installed and falls back to the standard library.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """
+    Parse a JSON document.
+    
+    Args:
+        data: Raw JSON payload, e.g. httpx ``response.content``
+        
+    Returns:
+        Parsed Python object
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def response_json(response) -> Any:
+    """
+    Parse the body of an HTTP response as JSON.
+    
+    Args:
+        response: httpx Response object
+        
+    Returns:
+        Parsed Python object
+    """
+    return loads(response.content)
@@ -3,13 +3,23 @@ Enhanced logging utilities for the harvest package.
 """
 
 import logging
+import logging.handlers
 import json
 import sys
 import os
+import atexit
+import threading
+import time
+import weakref
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any
 
+# File handlers are wrapped in a BufferedHandler unless PIXVAULT_LOG_BUFFER=0
+LOG_BUFFER_ENABLED = os.environ.get('PIXVAULT_LOG_BUFFER', '1') != '0'
+LOG_BUFFER_CAPACITY = 1024
+LOG_FLUSH_INTERVAL = 0.25
+
 
 class ColoredFormatter(logging.Formatter):
     """Colored console formatter for logs."""
@@ -85,6 +95,62 @@ class JSONFormatter(logging.Formatter):
         return json.dumps(log_entry, ensure_ascii=False)
 
 
+class BufferedHandler(logging.handlers.MemoryHandler):
+    """
+    Batch log records in memory and write them to a target handler in bulk.
+    
+    Records are flushed when the buffer is full, when an ERROR (or higher)
+    record arrives, periodically from a background thread and at exit.
+    """
+    
+    def __init__(self, target: logging.Handler, capacity: int = LOG_BUFFER_CAPACITY):
+        super().__init__(capacity, flushLevel=logging.ERROR, target=target, flushOnClose=True)
+        # MemoryHandler forwards records without a level check, so mirror the target's level
+        self.setLevel(target.level)
+        _register_buffered_handler(self)
+
+
+_buffered_handlers = weakref.WeakSet()
+_flush_thread: Optional[threading.Thread] = None
+_flush_lock = threading.Lock()
+
+
+def _flush_buffered_handlers() -> None:
+    """Flush every live BufferedHandler."""
+    for handler in list(_buffered_handlers):
+        try:
+            handler.flush()
+        except Exception:
+            pass
+
+
+def _flush_loop() -> None:
+    """Periodically flush buffered handlers so records never sit in memory for long."""
+    while True:
+        time.sleep(LOG_FLUSH_INTERVAL)
+        _flush_buffered_handlers()
+
+
+def _register_buffered_handler(handler: BufferedHandler) -> None:
+    """Track a buffered handler and start the background flusher on first use."""
+    global _flush_thread
+    
+    _buffered_handlers.add(handler)
+    
+    with _flush_lock:
+        if _flush_thread is None:
+            _flush_thread = threading.Thread(target=_flush_loop, name="log-flusher", daemon=True)
+            _flush_thread.start()
+            atexit.register(_flush_buffered_handlers)
+
+
+def _wrap_file_handler(handler: logging.Handler) -> logging.Handler:
+    """Wrap a file handler in a BufferedHandler when log buffering is enabled."""
+    if not LOG_BUFFER_ENABLED:
+        return handler
+    return BufferedHandler(handler)
+
+
 def setup_logger(name: str = "harvest", 
                 level: str = "INFO",
                 enable_console: bool = True,
@@ -106,7 +172,9 @@ def setup_logger(name: str = "harvest",
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, level.upper()))
     
-    # Clear existing handlers to avoid duplicates
+    # Clear existing handlers to avoid duplicates, writing out any buffered records first
+    for handler in logger.handlers:
+        handler.flush()
     logger.handlers.clear()
     
     # Console handler with colored output
@@ -127,7 +195,7 @@ def setup_logger(name: str = "harvest",
         )
         info_handler.setLevel(logging.INFO)
         info_handler.setFormatter(JSONFormatter())
-        logger.addHandler(info_handler)
+        logger.addHandler(_wrap_file_handler(info_handler))
         
         # Error log file (ERROR and above)
         error_handler = logging.FileHandler(
@@ -136,7 +204,7 @@ def setup_logger(name: str = "harvest",
         )
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(JSONFormatter())
-        logger.addHandler(error_handler)
+        logger.addHandler(_wrap_file_handler(error_handler))
     
     # Prevent propagation to root logger
     logger.propagate = False
@@ -6,7 +6,9 @@ This demonstrates how to use the AdapterManager class.
 
 import os
 import sys
-from harvest.adapters.manager import get_all_adapters, get_adapter
+import asyncio
+from harvest.adapters import SOURCE_REGISTRY, BaseAdapter
+from harvest.adapters.manager import AdapterManager, get_all_adapters, get_adapter
 from harvest.config import load_config
 
 def test_adapter_manager():
@@ -102,5 +104,63 @@ def test_adapter_manager():
         import traceback
         traceback.print_exc()
 
+class _FlakyAdapter:
+    """Stub adapter that swallows its first failure and returns [], like real adapters."""
+    
+    def __init__(self):
+        self.calls = 0
+    
+    def search(self, query, limit=10):
+        self.calls += 1
+        if self.calls == 1:
+            return []  # e.g. rate limited; the error was logged and swallowed
+        return [{'url': f'https://example.com/{query}.jpg'}]
+
+
+class _SteadyAdapter:
+    """Stub adapter that always returns one result."""
+    
+    def __init__(self):
+        self.calls = 0
+    
+    def search(self, query, limit=10):
+        self.calls += 1
+        return [{'url': f'https://example.org/{query}.jpg'}]
+
+
+def test_search_cache_skips_failed_source():
+    """A source that came back empty isn't cached, so the next search retries it."""
+    for run_search in (
+        lambda manager: manager.search_all("cats", 5),
+        lambda manager: asyncio.run(manager.search_all_async("cats", 5)),
+    ):
+        manager = AdapterManager({'sources': [], 'search_cache_ttl': 60})
+        flaky, steady = _FlakyAdapter(), _SteadyAdapter()
+        manager.adapters = {'flaky': flaky, 'steady': steady}
+        
+        first = run_search(manager)
+        assert first['flaky'] == [] and len(first['steady']) == 1
+        
+        second = run_search(manager)
+        assert flaky.calls == 2, "Failed source should be searched again"
+        assert len(second['flaky']) == 1
+        
+        # Complete results are cached
+        third = run_search(manager)
+        assert flaky.calls == 2 and steady.calls == 2
+        assert third == second
+
+
+def test_source_registry_maps_classes():
+    """SOURCE_REGISTRY maps each source name to its adapter class."""
+    assert sorted(SOURCE_REGISTRY) == ['bing', 'pexels', 'unsplash']
+    for name, adapter_class in SOURCE_REGISTRY.items():
+        assert issubclass(adapter_class, BaseAdapter), name
+    assert SOURCE_REGISTRY['bing'].__name__ == 'BingAdapter'
+    assert 'flickr' not in SOURCE_REGISTRY
+
+
 if __name__ == "__main__":
     test_adapter_manager()
+    test_search_cache_skips_failed_source()
+    test_source_registry_maps_classes()
@@ -8,15 +8,20 @@ import os
 import sys
 import time
 import shutil
+import hashlib
+import tempfile
+import yaml
 from pathlib import Path
 from datetime import datetime
 
 # Add the project root to the Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+import harvest.backup as backup_module
 from harvest.backup import (
     BackupManager, backup_storage, restore_backup,
-    get_backup_list, cleanup_old_backups, get_backup_stats
+    get_backup_list, cleanup_old_backups, get_backup_stats,
+    BLAKE3_AVAILABLE, ZSTD_AVAILABLE, ISAL_AVAILABLE, CHECKSUM_PREFIXES, checksum_algorithm_of
 )
 from harvest.backup_encryption import (
     BackupEncryption, BackupCompression, SecureBackup,
@@ -466,6 +471,109 @@ def test_database_operations():
         return False
 
 
+def _make_manager(tmp: str, **backup_options) -> BackupManager:
+    """Create a BackupManager whose storage, backups and config live under tmp."""
+    storage = os.path.join(tmp, "storage")
+    Path(storage, "sub").mkdir(parents=True, exist_ok=True)
+    Path(storage, "a.txt").write_text("alpha")
+    Path(storage, "sub", "b.bin").write_bytes(os.urandom(200000))
+    
+    config_path = os.path.join(tmp, "config.yaml")
+    backup_config = {
+        'storage_path': storage,
+        'backup_root': os.path.join(tmp, "backups"),
+        'exclude_patterns': [],
+        **backup_options,
+    }
+    with open(config_path, "w") as f:
+        yaml.safe_dump({'backup': backup_config}, f)
+    return BackupManager(config_path)
+
+
+def test_checksum_tags():
+    """Checksums carry their algorithm tag; untagged legacy SHA256 still verifies."""
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = _make_manager(tmp)
+        try:
+            path = os.path.join(tmp, "storage", "sub", "b.bin")
+            data = Path(path).read_bytes()
+            
+            checksum = manager._calculate_checksum(path)
+            if BLAKE3_AVAILABLE:
+                import blake3
+                assert checksum == "b3:" + blake3.blake3(data).hexdigest()
+            else:
+                assert checksum == "b2:" + hashlib.blake2b(data).hexdigest()
+            
+            blake2b_checksum = manager._calculate_checksum(path, "blake2b")
+            assert blake2b_checksum == "b2:" + hashlib.blake2b(data).hexdigest()
+            legacy_checksum = hashlib.sha256(data).hexdigest()
+            assert manager._calculate_checksum(path, "sha256") == legacy_checksum
+            
+            assert checksum_algorithm_of(checksum) == ("blake3" if BLAKE3_AVAILABLE else "blake2b")
+            assert checksum_algorithm_of(blake2b_checksum) == "blake2b"
+            assert checksum_algorithm_of("b3:" + "0" * 64) == "blake3"
+            assert checksum_algorithm_of(legacy_checksum) == "sha256"
+            
+            for stored in (checksum, blake2b_checksum, legacy_checksum):
+                assert manager.verify_checksum(path, stored)
+            assert not manager.verify_checksum(path, hashlib.sha256(b"other").hexdigest())
+            assert not manager.verify_checksum(path, CHECKSUM_PREFIXES["blake2b"] + "0" * 128)
+        finally:
+            manager.close()
+
+
+def _tree_contents(root: str) -> dict:
+    """Map relative file paths under root to their contents."""
+    return {
+        path.relative_to(root).as_posix(): path.read_bytes()
+        for path in sorted(Path(root).rglob("*")) if path.is_file()
+    }
+
+
+def _compressed_round_trip(compression_format: str, archive_name: str):
+    """Full compressed backup then restore; checks archive checksum and contents."""
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = _make_manager(tmp, compression=True, compression_format=compression_format)
+        try:
+            dest = os.path.join(tmp, "backups", "full")
+            metadata = manager.backup_storage(dest)
+            assert metadata.status == "success", metadata.error_message
+            
+            archive = os.path.join(dest, archive_name)
+            assert os.listdir(dest) == [archive_name]
+            # Checksum hashed while writing matches one computed from the file
+            assert metadata.checksum == manager._calculate_checksum(archive)
+            assert manager.verify_checksum(archive, metadata.checksum)
+            
+            restored = os.path.join(tmp, "restored")
+            assert manager.restore_backup(archive, restored)
+            source = os.path.join(tmp, "storage")
+            assert _tree_contents(os.path.join(restored, "storage")) == _tree_contents(source)
+        finally:
+            manager.close()
+
+
+def test_compressed_backup_round_trip():
+    """tar.zst and tar.gz (ISA-L and zlib) backups restore and checksum correctly."""
+    if ZSTD_AVAILABLE:
+        _compressed_round_trip('zstd', 'storage_backup.tar.zst')
+    
+    # pigz is used when installed; hide it to exercise the in-process backends
+    original_which = backup_module.shutil.which
+    original_isal = backup_module.ISAL_AVAILABLE
+    backup_module.shutil.which = lambda name, *args, **kwargs: None if name == "pigz" else original_which(name, *args, **kwargs)
+    try:
+        if ISAL_AVAILABLE:
+            _compressed_round_trip('gzip', 'storage_backup.tar.gz')
+        # zlib fallback for both writing and restoring
+        backup_module.ISAL_AVAILABLE = False
+        _compressed_round_trip('gzip', 'storage_backup.tar.gz')
+    finally:
+        backup_module.shutil.which = original_which
+        backup_module.ISAL_AVAILABLE = original_isal
+
+
 def cleanup_test_files():
     """Clean up test files."""
     print("\nCleaning up test files...")
@@ -527,6 +635,8 @@ def main():
     test_backup_cli()
     test_cleanup()
     test_database_operations()
+    test_checksum_tags()
+    test_compressed_backup_round_trip()
     
     # Cleanup
     cleanup_test_files()
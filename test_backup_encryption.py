@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Test script for PixVault backup encryption and compression.
+Tests directory archiving, the encrypted file format and secure backups.
+"""
+
+import os
+import sys
+import base64
+import socket
+import tarfile
+import tempfile
+from pathlib import Path
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from harvest.backup_encryption import (
+    BackupEncryption, BackupCompression, SecureBackup, MAGIC, HEADER_SIZE, TAG_SIZE
+)
+
+
+def _make_tree(root: str):
+    """Create a small directory tree with nested directories."""
+    Path(root, "sub", "deep").mkdir(parents=True)
+    Path(root, "a.txt").write_text("alpha")
+    Path(root, "sub", "b.txt").write_text("beta")
+    Path(root, "sub", "deep", "c.bin").write_bytes(os.urandom(4096))
+
+
+def _tree_contents(root: str) -> dict:
+    """Map relative paths to file contents (or link targets) under root."""
+    contents = {}
+    for path in sorted(Path(root).rglob("*")):
+        rel = path.relative_to(root).as_posix()
+        if path.is_symlink():
+            contents[rel] = ("link", os.readlink(path))
+        elif path.is_file():
+            contents[rel] = ("file", path.read_bytes())
+        elif path.is_dir():
+            contents[rel] = ("dir", None)
+    return contents
+
+
+def test_add_directory_skips_sockets():
+    """Archiving a tree with a Unix socket skips it like tar.add()."""
+    if not hasattr(socket, "AF_UNIX"):
+        return
+    
+    # Short base path: socket paths are limited to ~100 bytes
+    with tempfile.TemporaryDirectory(dir="/tmp") as tmp:
+        src = os.path.join(tmp, "src")
+        _make_tree(src)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.bind(os.path.join(src, "sub", "s.sock"))
+            
+            reference = os.path.join(tmp, "ref.tar")
+            with tarfile.open(reference, "w") as tar:
+                tar.add(src, arcname=".")
+            archived = os.path.join(tmp, "new.tar")
+            with tarfile.open(archived, "w") as tar:
+                BackupCompression.add_directory(tar, src)
+            with open(reference, "rb") as f_ref, open(archived, "rb") as f_new:
+                assert f_ref.read() == f_new.read(), "Archive should match tar.add()"
+            
+            output = os.path.join(tmp, "out.tar.gz")
+            assert BackupCompression.compress_directory(src, output)
+            assert BackupCompression.decompress_directory(output, os.path.join(tmp, "out"))
+        finally:
+            sock.close()
+        
+        expected = {rel: entry for rel, entry in _tree_contents(src).items() if rel != "sub/s.sock"}
+        assert _tree_contents(os.path.join(tmp, "out")) == expected
+
+
+def test_encrypt_decrypt_round_trip():
+    """Encrypted files use the PVB2 layout and decrypt to the original."""
+    with tempfile.TemporaryDirectory() as tmp:
+        plain = os.path.join(tmp, "plain.bin")
+        data = os.urandom(3 * 1024 * 1024 + 123)
+        Path(plain).write_bytes(data)
+        
+        encryption = BackupEncryption("secret")
+        encrypted = os.path.join(tmp, "plain.enc")
+        assert encryption.encrypt_file(plain, encrypted)
+        raw = Path(encrypted).read_bytes()
+        assert raw.startswith(MAGIC)
+        assert len(raw) == HEADER_SIZE + len(data) + TAG_SIZE
+        
+        # A fresh instance derives the key from the stored salt
+        decrypted = os.path.join(tmp, "plain.dec")
+        assert BackupEncryption("secret").decrypt_file(encrypted, decrypted)
+        assert Path(decrypted).read_bytes() == data
+
+
+def test_tampered_ciphertext_rejected():
+    """Flipping one bit in the header, ciphertext or tag fails authentication."""
+    with tempfile.TemporaryDirectory() as tmp:
+        plain = os.path.join(tmp, "plain.bin")
+        Path(plain).write_bytes(os.urandom(10000))
+        encrypted = os.path.join(tmp, "plain.enc")
+        assert BackupEncryption("secret").encrypt_file(plain, encrypted)
+        original = Path(encrypted).read_bytes()
+        
+        for offset in (len(MAGIC) + 1, HEADER_SIZE + 5000, len(original) - 1):
+            tampered = bytearray(original)
+            tampered[offset] ^= 0x01
+            Path(encrypted).write_bytes(bytes(tampered))
+            decrypted = os.path.join(tmp, "plain.dec")
+            assert not BackupEncryption("secret").decrypt_file(encrypted, decrypted)
+            assert not os.path.exists(decrypted), "No plaintext should be written"
+            with open(encrypted, "rb") as f:
+                try:
+                    BackupEncryption("secret").open_decrypted_reader(f)
+                except ValueError:
+                    pass
+                else:
+                    raise AssertionError(f"Tampering at byte {offset} was not detected")
+
+
+def test_wrong_password_rejected():
+    """Decrypting with the wrong password fails."""
+    with tempfile.TemporaryDirectory() as tmp:
+        plain = os.path.join(tmp, "plain.bin")
+        Path(plain).write_bytes(b"top secret")
+        encrypted = os.path.join(tmp, "plain.enc")
+        assert BackupEncryption("secret").encrypt_file(plain, encrypted)
+        
+        assert not BackupEncryption("wrong").decrypt_file(encrypted, os.path.join(tmp, "plain.dec"))
+        with open(encrypted, "rb") as f:
+            try:
+                BackupEncryption("wrong").open_decrypted_reader(f)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError("Wrong password was not detected")
+
+
+def test_truncated_file_raises():
+    """Files cut short anywhere after the magic raise ValueError."""
+    with tempfile.TemporaryDirectory() as tmp:
+        plain = os.path.join(tmp, "plain.bin")
+        Path(plain).write_bytes(os.urandom(2048))
+        encrypted = os.path.join(tmp, "plain.enc")
+        assert BackupEncryption("secret").encrypt_file(plain, encrypted)
+        original = Path(encrypted).read_bytes()
+        
+        for length in (len(MAGIC) + 3, HEADER_SIZE + TAG_SIZE - 1, len(original) - 1):
+            Path(encrypted).write_bytes(original[:length])
+            with open(encrypted, "rb") as f:
+                try:
+                    BackupEncryption("secret").open_decrypted_reader(f)
+                except ValueError:
+                    pass
+                else:
+                    raise AssertionError(f"Truncation to {length} bytes was not detected")
+
+
+def test_legacy_fernet_file_decrypts():
+    """Files in the old salt + Fernet token layout still decrypt."""
+    from cryptography.fernet import Fernet
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        encryption = BackupEncryption("secret")
+        salt = os.urandom(16)
+        key = encryption._derive_key(salt)
+        token = Fernet(base64.urlsafe_b64encode(key)).encrypt(b"legacy backup data")
+        legacy = os.path.join(tmp, "legacy.enc")
+        Path(legacy).write_bytes(salt + token)
+        
+        decrypted = os.path.join(tmp, "legacy.dec")
+        assert BackupEncryption("secret").decrypt_file(legacy, decrypted)
+        assert Path(decrypted).read_bytes() == b"legacy backup data"
+
+
+def test_secure_backup_round_trip():
+    """A streamed secure backup restores the tree exactly and verifies."""
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, "src")
+        _make_tree(src)
+        # Larger than one stream chunk, so it spans several cipher updates
+        Path(src, "sub", "large.bin").write_bytes(os.urandom(3 * 1024 * 1024 + 7))
+        os.symlink(os.path.join("sub", "b.txt"), os.path.join(src, "link.txt"))
+        
+        secure_backup = SecureBackup("secret")
+        backup_path = os.path.join(tmp, "backup.enc")
+        assert secure_backup.create_secure_backup(src, backup_path)
+        assert secure_backup.verify_backup(backup_path)
+        
+        restored = os.path.join(tmp, "restored")
+        assert SecureBackup("secret").restore_secure_backup(backup_path, restored)
+        assert _tree_contents(restored) == _tree_contents(src)
+        assert os.path.islink(os.path.join(restored, "link.txt"))
+        
+        # Corruption and a wrong password both fail verification
+        assert not SecureBackup("wrong").verify_backup(backup_path)
+        data = bytearray(Path(backup_path).read_bytes())
+        data[HEADER_SIZE + 100] ^= 0x01
+        Path(backup_path).write_bytes(bytes(data))
+        assert not secure_backup.verify_backup(backup_path)
+
+
+def test_sharded_backup_round_trip():
+    """A parallel sharded backup verifies and restores files and symlinks."""
+    with tempfile.TemporaryDirectory(dir="/tmp") as tmp:
+        src = os.path.join(tmp, "src")
+        _make_tree(src)
+        os.symlink(os.path.join("sub", "b.txt"), os.path.join(src, "link.txt"))
+        os.symlink("deep", os.path.join(src, "sub", "deep_link"))
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) if hasattr(socket, "AF_UNIX") else None
+        if sock is not None:
+            sock.bind(os.path.join(src, "s.sock"))
+        
+        try:
+            secure_backup = SecureBackup("secret")
+            backup_dir = os.path.join(tmp, "sharded")
+            assert secure_backup.create_sharded_backup(src, backup_dir, max_workers=2)
+        finally:
+            if sock is not None:
+                sock.close()
+        assert secure_backup.verify_sharded_backup(backup_dir)
+        assert not SecureBackup("wrong").verify_sharded_backup(backup_dir)
+        
+        restored = os.path.join(tmp, "restored")
+        assert SecureBackup("secret").restore_sharded_backup(backup_dir, restored, max_workers=2)
+        assert _tree_contents(restored) == _tree_contents(src)
+        assert os.path.islink(os.path.join(restored, "sub", "deep_link"))
+        assert not os.path.exists(os.path.join(restored, "s.sock"))
+        
+        # A corrupted shard fails verification
+        shard = sorted(name for name in os.listdir(backup_dir) if name != "manifest.enc")[0]
+        shard_path = os.path.join(backup_dir, shard)
+        data = bytearray(Path(shard_path).read_bytes())
+        data[-1] ^= 0x01
+        Path(shard_path).write_bytes(bytes(data))
+        assert not secure_backup.verify_sharded_backup(backup_dir)
+
+
+if __name__ == "__main__":
+    tests = [
+        test_add_directory_skips_sockets,
+        test_encrypt_decrypt_round_trip,
+        test_tampered_ciphertext_rejected,
+        test_wrong_password_rejected,
+        test_truncated_file_raises,
+        test_legacy_fernet_file_decrypts,
+        test_secure_backup_round_trip,
+        test_sharded_backup_round_trip,
+    ]
+    for test in tests:
+        test()
+        print(f"✓ {test.__name__}")
+    print("All backup encryption tests passed!")
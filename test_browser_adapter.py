@@ -5,13 +5,53 @@ Demonstrates integration with the existing PixVault system.
 """
 
 import asyncio
+import json
+import shutil
+import subprocess
 import sys
 import os
 
 # Add the project root to the Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from harvest.adapters.browser import fetch_images_sync, fetch_images
+import playwright.async_api
+
+import harvest.adapters.browser as browser_module
+from harvest.adapters.browser import BrowserAdapter, fetch_images_sync, fetch_images, EXTRACT_JS_PATH, MIN_IMAGE_SIZE
+from harvest.adapters.proxy_browser import ProxyBrowserAdapter, fetch_images_with_proxy
+
+# Page fixture as the extractor sees it with images and stylesheets blocked:
+# nothing decodes (naturalWidth 0), and CSS-sized images have no layout size
+EXTRACT_FIXTURE = [
+    {'src': 'https://example.com/css-thumb.jpg', 'attrs': {}, 'width': 0, 'height': 0},
+    {'src': 'https://example.com/icon.png', 'attrs': {'width': '16', 'height': '16'}, 'width': 16, 'height': 16},
+    {'src': 'https://example.com/declared.jpg', 'attrs': {'width': '300', 'height': '200'}, 'width': 300, 'height': 200},
+    {'src': 'data:image/gif;base64,R0lGOD', 'dataset': {'src': 'https://example.com/lazy.jpg'}, 'attrs': {}, 'width': 0, 'height': 0},
+    {'src': 'https://example.com/decoded-small.png', 'naturalWidth': 24, 'naturalHeight': 24, 'attrs': {}, 'width': 0, 'height': 0},
+    {'src': 'https://example.com/css-thumb.jpg', 'attrs': {}, 'width': 0, 'height': 0},
+]
+
+# Minimal DOM stand-in so extract.js can run under Node
+EXTRACT_HARNESS = """
+const fs = require('fs');
+const [scriptPath, fixtureJson, minSize] = process.argv.slice(1);
+const fixture = JSON.parse(fixtureJson);
+global.window = {};
+global.document = {
+    querySelectorAll: () => fixture.map(img => ({
+        src: img.src,
+        dataset: img.dataset || {},
+        naturalWidth: img.naturalWidth || 0,
+        naturalHeight: img.naturalHeight || 0,
+        width: img.width,
+        height: img.height,
+        getAttribute: name => (name in img.attrs ? img.attrs[name] : null),
+    })),
+};
+eval(fs.readFileSync(scriptPath, 'utf8'));
+const size = Number(minSize);
+console.log(JSON.stringify(window.__pvExtract(size, size, null).map(image => image.url)));
+"""
 
 
 async def test_async():
@@ -42,6 +82,113 @@ def test_sync():
         return []
 
 
+def test_extract_css_sized_images():
+    """CSS-sized images of unknown size survive extraction with loads blocked."""
+    node = shutil.which("node")
+    if node is None:
+        print("Skipping extractor test: node is not installed")
+        return
+    
+    result = subprocess.run(
+        [node, "-e", EXTRACT_HARNESS, EXTRACT_JS_PATH, json.dumps(EXTRACT_FIXTURE), str(MIN_IMAGE_SIZE)],
+        capture_output=True, text=True, check=True
+    )
+    urls = json.loads(result.stdout)
+    assert urls == [
+        "https://example.com/css-thumb.jpg",
+        "https://example.com/declared.jpg",
+        "https://example.com/lazy.jpg",
+    ], urls
+
+
+class _FakeBrowser:
+    """Stand-in for a launched Chromium."""
+    
+    def __init__(self):
+        self.open = True
+    
+    def is_connected(self):
+        return self.open
+    
+    async def close(self):
+        self.open = False
+
+
+class _FakePlaywright:
+    """Stand-in for a started Playwright driver."""
+    
+    def __init__(self):
+        self.running = True
+    
+    async def start(self):
+        return self
+    
+    async def stop(self):
+        self.running = False
+
+
+def test_browser_closed_after_each_loop():
+    """Adapters on a loop share one browser, closed when the last of them exits."""
+    launched = []
+    drivers = []
+    
+    def fake_async_playwright():
+        driver = _FakePlaywright()
+        drivers.append(driver)
+        return driver
+    
+    async def fake_launch_chromium(driver):
+        browser = _FakeBrowser()
+        launched.append(browser)
+        return browser
+    
+    original_playwright = playwright.async_api.async_playwright
+    original_launch = browser_module.launch_chromium
+    original_engines = browser_module._ENGINES
+    playwright.async_api.async_playwright = fake_async_playwright
+    browser_module.launch_chromium = fake_launch_chromium
+    browser_module._ENGINES = []
+    try:
+        async def fetch_both():
+            async with BrowserAdapter() as adapter, ProxyBrowserAdapter({}) as proxy_adapter:
+                assert adapter.browser is proxy_adapter.browser
+                return await asyncio.gather(
+                    adapter.fetch_images("test query", max_results=1),
+                    proxy_adapter.fetch_images("test query", max_results=1),
+                )
+        
+        for _ in range(2):
+            assert asyncio.run(fetch_both()) == [[], []]
+        assert asyncio.run(fetch_images_with_proxy("test query", max_results=1, config={})) == []
+        
+        assert len(launched) == 3, launched
+        assert not any(browser.open for browser in launched)
+        assert not any(driver.running for driver in drivers)
+    finally:
+        playwright.async_api.async_playwright = original_playwright
+        browser_module.launch_chromium = original_launch
+        browser_module._ENGINES = original_engines
+
+
+class _SlowAdapter(BrowserAdapter):
+    """Adapter whose engine searches succeed only after the retry budget has run out."""
+    
+    async def _search_attempt(self, query, search_engine, max_results):
+        await asyncio.sleep(0.2)
+        return [{'url': f"https://example.com/{search_engine['name']}.jpg", 'source': search_engine['name']}]
+
+
+def test_retry_budget_does_not_cut_attempts_short():
+    """The retry deadline stops new retries but never cancels an attempt in flight."""
+    async def fetch():
+        adapter = _SlowAdapter({'retry_budget_seconds': 0.05, 'max_concurrent_engines': 10})
+        adapter.browser = object()
+        return await adapter.fetch_images("test query", max_results=10)
+    
+    results = asyncio.run(fetch())
+    assert len(results) == len(browser_module._ENGINES), results
+
+
 def test_integration():
     """Test integration with existing downloader system."""
     print("\nTesting integration with existing system...")
@@ -82,6 +229,15 @@ async def main():
     # Test integration
     test_integration()
     
+    # Test in-page extractor size filtering
+    test_extract_css_sized_images()
+    
+    # Test browsers are closed with their event loop
+    test_browser_closed_after_each_loop()
+    
+    # Test the retry budget leaves attempts in flight alone
+    test_retry_budget_does_not_cut_attempts_short()
+    
     print("\n" + "=" * 40)
     print("Test completed!")
     print("\nTo use the browser adapter in your code:")
@@ -150,6 +150,33 @@ def test_exception_logging():
     print("Exception logging test completed!")
 
 
+def test_buffered_file_logging():
+    """Test that buffered file handlers write records out on flush."""
+    print("\nTesting buffered file logging...")
+    
+    logger = setup_logger(
+        name="test.buffered",
+        level="INFO",
+        enable_console=False,
+        enable_file_logging=True,
+        log_dir="test_logs/buffered"
+    )
+    
+    logger.info("Buffered INFO message")
+    for handler in logger.handlers:
+        handler.flush()
+    
+    info_log = Path("test_logs/buffered/info.log")
+    assert "Buffered INFO message" in info_log.read_text(encoding='utf-8')
+    
+    # ERROR records are written through immediately
+    logger.error("Buffered ERROR message")
+    error_log = Path("test_logs/buffered/error.log")
+    assert "Buffered ERROR message" in error_log.read_text(encoding='utf-8')
+    
+    print("Buffered file logging test completed!")
+
+
 def main():
     """Run all logger tests."""
     print("Enhanced Logger Test Suite")
@@ -162,6 +189,7 @@ def main():
         ("File Logging", test_file_logging),
         ("Different Loggers", test_different_loggers),
         ("Exception Logging", test_exception_logging),
+        ("Buffered File Logging", test_buffered_file_logging),
     ]
     
     for test_name, test_func in tests:
@@ -6,7 +6,10 @@ This demonstrates User-Agent rotation and proxy functionality.
 
 import os
 import sys
-from harvest.utils.http_client import get_http_client, reset_http_client
+import asyncio
+import threading
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from harvest.utils.http_client import HTTPClient, get_http_client, reset_http_client
 from harvest.config import load_config
 
 def test_http_client():
@@ -113,5 +116,47 @@ def test_http_client():
         import traceback
         traceback.print_exc()
 
+class _OkHandler(BaseHTTPRequestHandler):
+    """Local handler answering every GET with a short 200 response."""
+    
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+    
+    def log_message(self, format, *args):
+        pass
+
+
+def test_async_clients_closed_between_loops():
+    """Each asyncio.run gets its own async client, closed when that loop ends."""
+    server = HTTPServer(("127.0.0.1", 0), _OkHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/"
+    http_client = HTTPClient({'max_retries': 1})
+    
+    async def fetch():
+        response = await http_client.aget(url)
+        assert response.text == "ok"
+        return list(http_client._async_clients[asyncio.get_running_loop()].values())
+    
+    try:
+        first_clients = asyncio.run(fetch())
+        assert first_clients and all(client.is_closed for client in first_clients), \
+            "Clients should be closed when their loop finishes"
+        
+        second_clients = asyncio.run(fetch())
+        assert not set(map(id, first_clients)) & set(map(id, second_clients)), \
+            "A new loop should get new clients"
+        assert all(client.is_closed for client in second_clients)
+        assert len(http_client._async_clients) == 0, "Finished loops should be forgotten"
+    finally:
+        http_client.close()
+        server.shutdown()
+        server.server_close()
+
+
 if __name__ == "__main__":
     test_http_client()
+    test_async_clients_closed_between_loops()
@@ -33,9 +33,13 @@ def test_pexels_adapter():
             print(f"   ID: {result['id']}")
             print(f"   Title: {result['title']}")
             print(f"   Size: {result['width']}x{result['height']}")
-            print(f"   Photographer: {result['photographer']}")
             print(f"   Source: {result['source']}")
-            print(f"   Average Color: {result['avg_color']}")
+        
+        # Photographer and color details are fetched on demand
+        if results:
+            metadata = adapter.get_full_metadata(results[0])
+            print(f"\n👤 Photographer: {metadata.get('photographer', '')}")
+            print(f"🎨 Average Color: {metadata.get('avg_color', '')}")
         
         # Test download functionality (only if we have results)
         if results: